@@ -0,0 +1,250 @@
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+
+
+LETTERS = "abcde"
+# Diğer süreçlerin yazdığı istatistiklerin en fazla kaç saniye gecikmeyle görüleceği
+REFRESH_INTERVAL = 30.0
+
+logger = logging.getLogger("isg.analytics")
+
+
+class QuestionStats:
+    """Bir sorunun tüm oturumlardaki birikmiş istatistikleri; her cevap O(1) ile eklenir."""
+
+    __slots__ = ("attempts", "correct", "first_tries", "first_try_correct", "wrong_choices")
+
+    def __init__(self, attempts=0, correct=0, first_tries=0, first_try_correct=0, wrong_choices=None):
+        self.attempts = attempts
+        self.correct = correct
+        self.first_tries = first_tries
+        self.first_try_correct = first_try_correct
+        self.wrong_choices = list(wrong_choices) if wrong_choices else [0] * len(LETTERS)
+
+    def add(self, choice, correct, first_try):
+        self.attempts += 1
+        if correct:
+            self.correct += 1
+        if first_try:
+            self.first_tries += 1
+            if correct:
+                self.first_try_correct += 1
+        if not correct:
+            position = LETTERS.find(choice)
+            if position >= 0:
+                self.wrong_choices[position] += 1
+
+    def merge(self, other):
+        """Başka bir istatistiğin sayılarını bu istatistiğe ekler."""
+        self.attempts += other.attempts
+        self.correct += other.correct
+        self.first_tries += other.first_tries
+        self.first_try_correct += other.first_try_correct
+        self.wrong_choices = [a + b for a, b in zip(self.wrong_choices, other.wrong_choices)]
+
+    def copy(self):
+        return QuestionStats(self.attempts, self.correct, self.first_tries, self.first_try_correct, self.wrong_choices)
+
+    @property
+    def first_try_accuracy(self):
+        """İlk denemede doğru oranı; hiç ilk deneme yoksa None."""
+        return self.first_try_correct / self.first_tries if self.first_tries else None
+
+    @property
+    def most_common_wrong(self):
+        """En çok seçilen yanlış şık (harf) ve seçilme sayısı; yanlış cevap yoksa (None, 0)."""
+        count = max(self.wrong_choices)
+        return (LETTERS[self.wrong_choices.index(count)], count) if count else (None, 0)
+
+
+class AnswerAnalytics:
+    """
+    Tüm oturumlardaki cevapların yalnızca eklenen olay kaydı ve soru başına istatistikler.
+    record() bellekteki istatistiği O(1) ile günceller ve olayı sıraya alır; olayların ve
+    istatistik artışlarının SQLite'a yazılması arka plandaki bir iş parçacığında toplu yapılır.
+    Yalnızca istatistik tablosu okunur, olay geçmişi hiçbir zaman yeniden taranmaz.
+    Birden fazla süreç aynı dosyayı kullanabilir: diske mutlak değerler değil artışlar yazılır;
+    istatistik tablosu refresh_interval saniyede bir, okuma sırasında yeniden okunur.
+    """
+
+    def __init__(self, path, flush_interval=1.0, refresh_interval=REFRESH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.refresh_interval = refresh_interval
+        self._stats = {} # banka -> {soru no: QuestionStats}
+        self._pending_events = []
+        self._pending_deltas = {} # (banka, soru no) -> bu süreçte henüz yazılmamış artışlar
+        self._lock = threading.Lock()
+        # Diske yazma ile yeniden okuma aynı anda yapılmaz: yazılmakta olan artışlar ne sırada
+        # ne de tabloda göründüğü için aradaki okuma onları kaybederdi
+        self._io_lock = threading.Lock()
+        self._loaded_at = 0.0
+        self._wake = threading.Event()
+        self._closed = False
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answer_events ("
+                " id INTEGER PRIMARY KEY,"
+                " ts REAL NOT NULL,"
+                " bank TEXT NOT NULL,"
+                " question TEXT NOT NULL,"
+                " mode TEXT NOT NULL,"
+                " choice TEXT NOT NULL,"
+                " correct INTEGER NOT NULL,"
+                " first_try INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS question_stats ("
+                " bank TEXT NOT NULL,"
+                " question TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL,"
+                " correct INTEGER NOT NULL,"
+                " first_tries INTEGER NOT NULL,"
+                " first_try_correct INTEGER NOT NULL,"
+                + "".join(f" wrong_{letter} INTEGER NOT NULL," for letter in LETTERS)
+                + " PRIMARY KEY (bank, question))"
+            )
+        self.reload()
+
+        self._writer = threading.Thread(target=self._run, name="analytics-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def record(self, bank, question, mode, choice, correct, first_try):
+        """Bir cevabı kaydeder; cevap tıklamasında disk beklenmez."""
+        key = (bank, question)
+        with self._lock:
+            questions = self._stats.setdefault(bank, {})
+            stats = questions.get(question)
+            if stats is None:
+                stats = questions[question] = QuestionStats()
+            stats.add(choice, correct, first_try)
+            delta = self._pending_deltas.get(key)
+            if delta is None:
+                delta = self._pending_deltas[key] = QuestionStats()
+            delta.add(choice, correct, first_try)
+            self._pending_events.append((time.time(), bank, question, mode, choice, int(correct), int(first_try)))
+
+    def reload(self):
+        """
+        İstatistik tablosunu (diğer süreçlerin yazdıkları dahil) yeniden okur.
+        Bu süreçte henüz diske yazılmamış artışlar okunan değerlerin üstüne eklenir.
+        """
+        with self._io_lock:
+            stats = {}
+            with self._connect() as conn:
+                for row in conn.execute("SELECT * FROM question_stats"):
+                    bank, question, attempts, correct, first_tries, first_try_correct, *wrong = row
+                    stats.setdefault(bank, {})[question] = QuestionStats(
+                        attempts, correct, first_tries, first_try_correct, wrong,
+                    )
+            with self._lock:
+                for (bank, question), delta in self._pending_deltas.items():
+                    questions = stats.setdefault(bank, {})
+                    if question in questions:
+                        questions[question].merge(delta)
+                    else:
+                        questions[question] = delta.copy()
+                self._stats = stats
+                self._loaded_at = time.monotonic()
+
+    def _refresh_if_stale(self):
+        if time.monotonic() - self._loaded_at < self.refresh_interval:
+            return
+        try:
+            self.reload()
+        except sqlite3.Error:
+            pass # Okunamazsa bellekteki istatistiklerle devam edilir, sonraki okumada tekrar denenir
+
+    def question_stats(self, bank, question):
+        """Sorunun istatistiğinin bir kopyası; hiç cevaplanmadıysa None."""
+        self._refresh_if_stale()
+        with self._lock:
+            stats = self._stats.get(bank, {}).get(question)
+            return stats.copy() if stats is not None else None
+
+    def bank_stats(self, bank):
+        """Bankadaki cevaplanmış soruların {soru no: QuestionStats} sözlüğü (kopyalar)."""
+        self._refresh_if_stale()
+        with self._lock:
+            return {question: stats.copy() for question, stats in self._stats.get(bank, {}).items()}
+
+    def first_try_accuracy(self, bank):
+        """Sınav üreticisi için {soru no: ilk denemede doğru oranı}; ilk denemesi olmayan sorular yer almaz."""
+        return {
+            question: stats.first_try_accuracy
+            for question, stats in self.bank_stats(bank).items()
+            if stats.first_tries
+        }
+
+    def flush(self):
+        """Bekleyen olayları ve istatistik artışlarını tek bir işlemde diske yazar."""
+        with self._io_lock:
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            events, self._pending_events = self._pending_events, []
+            deltas, self._pending_deltas = self._pending_deltas, {}
+        if not events:
+            return
+        wrong_columns = [f"wrong_{letter}" for letter in LETTERS]
+        rows = [
+            (bank, question, d.attempts, d.correct, d.first_tries, d.first_try_correct, *d.wrong_choices)
+            for (bank, question), d in deltas.items()
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT INTO answer_events (ts, bank, question, mode, choice, correct, first_try)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    events,
+                )
+                conn.executemany(
+                    "INSERT INTO question_stats (bank, question, attempts, correct, first_tries, first_try_correct, "
+                    + ", ".join(wrong_columns) + ") VALUES (" + ", ".join("?" * (6 + len(LETTERS))) + ") "
+                    "ON CONFLICT(bank, question) DO UPDATE SET "
+                    + ", ".join(
+                        f"{column} = {column} + excluded.{column}"
+                        for column in ["attempts", "correct", "first_tries", "first_try_correct"] + wrong_columns
+                    ),
+                    rows,
+                )
+        except sqlite3.Error:
+            # Yazılamayan olaylar ve artışlar bir sonraki tur için geri konur
+            with self._lock:
+                self._pending_events[:0] = events
+                for key, delta in deltas.items():
+                    current = self._pending_deltas.get(key)
+                    if current is not None:
+                        delta.merge(current)
+                    self._pending_deltas[key] = delta
+            raise
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass # Kayıtlar sırada kaldı, bir sonraki turda tekrar denenecek
+            except Exception:
+                # Beklenmeyen bir hata yazıcıyı durdurmamalı; durdursaydı istatistikler bir daha kaydedilmezdi
+                logger.exception("Cevap istatistikleri %s dosyasına yazılamadı", self.path)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=5)
+        self.flush()
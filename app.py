@@ -1,124 +1,360 @@
 import streamlit as st
-import fitz # PyMuPDF kütüphanesi
-import re
 import os # Dosya kontrolü için
-import random # Soruları karıştırmak için
-
-
-# Dosya yolları doğrudan burada belirtiliyor, kullanıcı yüklemeyecek.
-# Artık PDF dosyalarını kullanıyoruz
-QUESTIONS_FILE = "sorular_ve_siklar.pdf"
-ANSWERS_FILE = "dogru_cevaplar.pdf"
-
-@st.cache_data
-def parse_questions_from_pdf(pdf_path):
+import re
+import uuid # Oturum belirteci için
+
+from bank_snapshot import source_fingerprint, load_snapshot, save_snapshot
+from question_bank import QuestionBank
+from scoreboard import Scoreboard
+from progress_store import ProgressStore, export_progress, restore_progress, clear_progress
+import metrics
+from blueprints import BlueprintPool, DIFFICULTY_STRATA_TAG, generate_blueprints, pick_base_seed, stratify_by_difficulty
+from answer_analytics import AnswerAnalytics
+from scheduler import LeitnerScheduler
+from search_index import SearchIndex
+from loaders import load_questions, load_answers
+from bank_catalog import DEFAULT_BANK_ID, load_catalog, source_paths
+from figures import FigureCache, FIGURE_CACHE_DIR, FIGURE_DPI
+
+
+# Sunulan bankaların kataloğu; dosya yoksa varsayılan kaynaklardan (DOCX/TXT, yoksa PDF) tek banka sunulur
+BANK_CATALOG = os.environ.get("ISG_BANK_CATALOG", "bankalar.json")
+# Bellekte aynı anda tutulacak en fazla banka sayısı; fazlası en uzun süre kullanılmayandan başlanarak atılır
+MAX_LOADED_BANKS = int(os.environ.get("ISG_MAX_LOADED_BANKS", "3"))
+# Seçilen bankanın sayfa yenilendiğinde korunması için adres çubuğunda taşınan parametre
+BANK_PARAM = "banka"
+# Büyük bankaların yeniden ayrıştırılmasında kullanılacak süreç sayısı (1 = sıralı okuma)
+PARSE_WORKERS = int(os.environ.get("ISG_PARSE_WORKERS", "1"))
+# 1 ise neredeyse aynı soru kümelerinden yalnızca ilk soru bankada tutulur
+COLLAPSE_DUPLICATES = os.environ.get("ISG_COLLAPSE_DUPLICATES") == "1"
+# Sınav kalıpları: soru sayısı, numara aralığına göre katman sayısı ve önceden üretilecek kalıp adedi
+EXAM_SIZE = int(os.environ.get("ISG_EXAM_SIZE", "20"))
+EXAM_STRATA = int(os.environ.get("ISG_EXAM_STRATA", "5"))
+EXAM_BLUEPRINT_COUNT = int(os.environ.get("ISG_EXAM_BLUEPRINTS", "200"))
+# Kalıp tohumlarının başlangıcı; verilmezse her süreç başlangıcında rastgele seçilir
+# (verilirse bütün süreçler ve static_export.py aynı kalıpları üretir)
+EXAM_SEED = int(os.environ["ISG_EXAM_SEED"]) if os.environ.get("ISG_EXAM_SEED") else None
+# "zorluk" ise sınav katmanları numara aralığı yerine soruların ilk denemede doğru oranına göre oluşturulur
+EXAM_STRATIFY = os.environ.get("ISG_EXAM_STRATIFY", "numara")
+# Bütün sınıfın aynı sınavı alması için adres çubuğunda verilebilecek sınav kodu parametresi
+EXAM_PARAM = "sinav"
+# Kullanıcı ilerlemesinin saklandığı yerel SQLite dosyası
+PROGRESS_DB = os.environ.get("ISG_PROGRESS_DB", "ilerleme.sqlite3")
+# Tüm oturumlardaki cevap olaylarının ve soru istatistiklerinin saklandığı yerel SQLite dosyası
+ANALYTICS_DB = os.environ.get("ISG_ANALYTICS_DB", "analitik.sqlite3")
+# Diğer sunucu süreçlerinin yazdığı istatistiklerin yeniden okunma aralığı (saniye)
+ANALYTICS_REFRESH = float(os.environ.get("ISG_ANALYTICS_REFRESH", "30"))
+# Soru istatistikleri görünümü: adres çubuğunda ?yonetim=<ISG_ADMIN_KEY> ile açılır (anahtar yoksa kapalıdır)
+ADMIN_PARAM = "yonetim"
+ADMIN_KEY = os.environ.get("ISG_ADMIN_KEY")
+# İlerlemenin geri yüklenmesi için adres çubuğunda taşınan oturum belirteci parametresi
+SESSION_TOKEN_PARAM = "oturum"
+# PDF'ten kırpılan soru şekillerinin disk önbelleği, boyut sınırı (MB) ve çizim çözünürlüğü
+FIGURE_CACHE = os.environ.get("ISG_FIGURE_CACHE", FIGURE_CACHE_DIR)
+FIGURE_CACHE_MB = int(os.environ.get("ISG_FIGURE_CACHE_MB", "200"))
+FIGURE_RENDER_DPI = int(os.environ.get("ISG_FIGURE_DPI", str(FIGURE_DPI)))
+# Kenar çubuğundaki durum listelerinde bir sayfada gösterilecek soru sayısı
+STATUS_PAGE_SIZE = 100
+# Arama sonuçlarından doğrudan gidilebilecek en fazla soru sayısı
+SEARCH_RESULT_LIMIT = 50
+# Şık radyo düğmelerinin oturum anahtarları ("q" + listedeki konum; aralıklı tekrarda "_" + tekrar turu)
+ANSWER_WIDGET_KEY = re.compile(r"q\d+(?:_\d+)?")
+
+@metrics.timed("parse_questions")
+def parse_questions(path, workers=1, figures_path=None):
     """
-    Belirtilen PDF dosya yolundan soru numarasını, metnini ve şıklarını ayrıştırır.
-    PDF içeriğini sayfa sayfa okur.
+    Belirtilen dosyadan soru numarasını, metnini ve şıklarını ayrıştırır.
+    Ayrıştırıcı dosya türüne göre seçilir (DOCX, TXT; diğerleri için PDF).
+    İçerik akış halinde okunur; sayfalar arasında yalnızca yarım kalan soru taşınır.
+    workers > 1 ise PDF sayfa metinleri süreç havuzunda çıkarılır.
+    figures_path verilirse soruların şekil bölgeleri bu PDF'ten bulunur.
     """
-    if not os.path.exists(pdf_path):
-        st.error(f"Sorular dosyası bulunamadı: {pdf_path}")
+    if not os.path.exists(path):
+        st.error(f"Sorular dosyası bulunamadı: {path}")
         return []
 
-    doc = fitz.open(pdf_path)
-    content = ""
-    for page in doc:
-        content += page.get_text("text", sort=True)
-    doc.close() # Belgeyi kapatmayı unutmayın
-
-    # Soru numarasını, metnini ve ardından gelen şıkları yakalamak için daha genel bir desen
-    # (\d+[.)]\s*.+?) : Soru numarası (örn: 1.), soru metni ve şıklar
-    # (?=\s*\d+[.)]|\Z) : Yeni bir soru numarası veya dosya sonu gelene kadar devam et
-    pattern = re.compile(r"(\d+[.)]\s*.+?)(?=\s*\d+[.)]|\Z)", re.DOTALL)
-    matches = re.findall(pattern, content)
-
-    parsed = []
-    for match in matches:
-        lines = [line.strip() for line in match.split('\n') if line.strip()]
-        if not lines:
-            continue
-        
-        # İlk satırın soru numarası ve metni olduğunu varsayalım
-        question_line = lines[0]
-        # Soru numarasını ve metnini ayır
-        question_num_match = re.match(r"^\s*(\d+)[.)]\s*(.*)", question_line)
-        if not question_num_match:
-            # Eğer ilk satır soru formatına uymuyorsa atla veya uyarı ver
-            st.warning(f"Soru formatı eşleşmedi, atlanıyor: {question_line[:50]}...")
-            continue
-
-        question_number = question_num_match.group(1).strip()
-        # question_text'i ilk satırın geri kalanından başlat
-        question_text_parts = [question_num_match.group(2).strip()]
-        options = []
-        
-        # Kalan satırları işle (çok satırlı soru metni veya şıklar)
-        for i in range(1, len(lines)):
-            line = lines[i]
-            # Şık harfini, noktayı/parantezi ve metni yakalar (örn: "A) Şık metni", "B. Şık metni")
-            option_match = re.match(r"^\s*([a-d])([.)])\s*(.*)", line, re.IGNORECASE)
-            if option_match:
-                options.append(line)
-            else:
-                # Şık değilse, soru metnine ekle
-                question_text_parts.append(line)
-        
-        parsed.append({
-            "number": question_number,
-            "question": " ".join(question_text_parts).strip(),
-            "options": options,
-        })
-    
-    return parsed
+    # Eğer ilk satır soru formatına uymuyorsa atla ve uyarı ver
+    def warn_skipped(question_line):
+        st.warning(f"Soru formatı eşleşmedi, atlanıyor: {question_line[:50]}...")
+
+    return load_questions(path, workers=workers, on_skip=warn_skipped, figures_path=figures_path)
 
-@st.cache_data
-def parse_correct_answers_from_pdf(pdf_path):
+@metrics.timed("parse_correct_answers")
+def parse_correct_answers(path):
     """
-    Belirtilen PDF dosya yolundan doğru cevapları ayrıştırır.
-    PDF içeriğini sayfa sayfa okur.
+    Belirtilen dosyadan doğru cevapları ayrıştırır.
+    Düz metin anahtar satır satır okunur; DOCX ve PDF için sayfa/paragraf akışı kullanılır.
     Format: '500. A', '500) A' veya '500: A'
     """
-    if not os.path.exists(pdf_path):
-        st.error(f"Cevaplar dosyası bulunamadı: {pdf_path}")
+    if not os.path.exists(path):
+        st.error(f"Cevaplar dosyası bulunamadı: {path}")
         return {}
 
-    doc = fitz.open(pdf_path)
-    content = ""
-    for page in doc:
-        content += page.get_text("text", sort=True)
-    doc.close()
-
-    correct_answers = {}
-    # Soru numarasını ve cevabı yakala: örn "500. A", "501) C" veya "502: B"
-    # Düzenli ifade güncellendi: [.:)] hem nokta, hem iki nokta üst üste hem de parantezi destekler
-    pattern = re.compile(r"(\d+)[.:)]\s*([A-D])", re.IGNORECASE)
-    matches = pattern.finditer(content) 
-
-    for match in matches:
-        question_number = match.group(1).strip()
-        answer_letter = match.group(2).strip().lower()
-        correct_answers[question_number] = answer_letter
-        
-    return correct_answers
+    return load_answers(path)
 
-# --- on_change callback fonksiyonu ---
-# Bu fonksiyon, st.radio bileşeni her değiştiğinde çağrılır.
-def handle_option_change(questions, correct_answers):
-    current_q_key = f"q{st.session_state.index}"
-    selected_option = st.session_state[current_q_key] # Seçilen şıkkın metni
+def load_question_bank(questions_path, answers_path, figures_path=None):
+    """
+    Soruları, doğru cevapları ve neredeyse aynı soru kümelerini derlenmiş anlık görüntüden yükler.
+    Kaynak dosyalar değişmediyse hiçbir kaynak dosya ayrıştırılmaz; değiştiyse yeniden ayrıştırılır,
+    kopya taraması yapılır ve yeni anlık görüntü diske yazılır (süreç yeniden başlasa da korunur).
+    Banka "python ingest.py" ile önceden derlenirse sunucu hiçbir zaman ayrıştırma yapmaz.
+    """
+    fingerprint = source_fingerprint(*source_paths(questions_path, answers_path, figures_path))
+    snapshot = load_snapshot(fingerprint)
+    if snapshot is not None:
+        return snapshot["questions"], snapshot["answers"], snapshot["duplicates"]
+
+    from dedup import find_duplicate_clusters # numpy yalnızca anlık görüntü ıskalamasında yüklenir
+
+    questions = parse_questions(questions_path, workers=PARSE_WORKERS, figures_path=figures_path)
+    correct_answers = parse_correct_answers(answers_path)
+    with metrics.span("find_duplicates"):
+        duplicates = find_duplicate_clusters(questions)
+    if questions and correct_answers:
+        try:
+            save_snapshot(fingerprint, questions, correct_answers, duplicates)
+        except OSError:
+            pass # Diske yazılamazsa uygulama yine de ayrıştırılan veriyle çalışır
+    return questions, correct_answers, duplicates
+
+@st.cache_resource
+def get_bank_catalog():
+    """Banka kataloğu süreç başında bir kez okunur; yeni bankalar için uygulama yeniden başlatılır."""
+    return load_catalog(BANK_CATALOG)
+
+@st.cache_resource(max_entries=MAX_LOADED_BANKS)
+def get_question_bank(questions_path, answers_path, figures_path, fingerprint):
+    """
+    Süreç genelinde paylaşılan soru bankasını döndürür; banka ilk kullanıldığında yüklenir.
+    st.cache_resource nesneyi kopyalamadan tüm oturumlara verir; fingerprint parametresi
+    kaynak dosyalar değiştiğinde yeni bir bankanın oluşturulmasını sağlar.
+    Önbellek en fazla MAX_LOADED_BANKS banka tutar (en uzun süre kullanılmayan atılır);
+    oturumlar bankanın kendisini değil yalnızca indeksleri sakladığı için atılan banka
+    bir sonraki kullanımda anlık görüntüden hızla yeniden yüklenir.
+    COLLAPSE_DUPLICATES açıksa kopya kümeleri tek soruya indirilir; soru indeksleri değiştiği için
+    banka farklı bir parmak izi taşır ve kayıtlı ilerlemeler karışmaz.
+    """
+    questions, correct_answers, duplicates = load_question_bank(questions_path, answers_path, figures_path)
+    if COLLAPSE_DUPLICATES and duplicates:
+        from dedup import collapse_clusters
 
-    question_num = questions[st.session_state.index]['number']
-    selected_letter = selected_option[0].lower().strip().replace('\ufeff', '')
-    
-    correct_answer = correct_answers.get(question_num, None)
-    correct_answer_cleaned = None
-    if correct_answer:
-        correct_answer_cleaned = correct_answer.strip().lower().replace('\ufeff', '')
+        questions = collapse_clusters(questions, duplicates)
+        fingerprint = f"{fingerprint}-tekil"
+    return QuestionBank(questions, correct_answers, fingerprint)
 
-    current_correctness = (selected_letter == correct_answer_cleaned) if correct_answer_cleaned else None
+@st.cache_resource(max_entries=MAX_LOADED_BANKS)
+def get_blueprint_pool(_bank, fingerprint, bank_id):
+    """
+    Bankaya ait sınav kalıplarını bir kez, toplu olarak üretir ve tüm oturumlarla paylaşır.
+    (_bank önbellek anahtarına katılmaz; bankayı parmak izi temsil eder.)
+    Zorluğa göre katmanlamada o anki soru istatistikleri kullanılır; bu kalıpların kodları
+    yalnızca havuz bellekteyken geçerlidir.
+    """
+    count = max(1, EXAM_BLUEPRINT_COUNT)
+    base_seed = pick_base_seed(EXAM_SEED)
+    if EXAM_STRATIFY == "zorluk":
+        accuracy = get_answer_analytics().first_try_accuracy(bank_id)
+        strata = stratify_by_difficulty(_bank, accuracy, EXAM_STRATA)
+        return BlueprintPool(generate_blueprints(_bank, count, EXAM_SIZE, base_seed, strata=strata, tag=DIFFICULTY_STRATA_TAG))
+    return BlueprintPool(generate_blueprints(_bank, count, EXAM_SIZE, base_seed, strata_count=EXAM_STRATA))
+
+@st.cache_resource(max_entries=MAX_LOADED_BANKS)
+def get_search_index(_bank, fingerprint):
+    """Bankanın ters indeksi; banka yüklendiğinde bir kez kurulur ve tüm oturumlarca paylaşılır."""
+    return SearchIndex(_bank)
+
+def start_exam(bank):
+    """
+    Oturuma bir sınav kalıbı atar. Adreste sınav kodu varsa o kalıp (gerekirse yeniden
+    üretilerek) kullanılır, yoksa havuzdaki sıradaki kalıp alınır. Oturum yalnızca kalıbın
+    kimliğini ve paylaşılan indeks dizisini tutar.
+    """
+    pool = get_blueprint_pool(bank, bank.fingerprint, st.session_state.active_bank_id)
+    requested_id = st.query_params.get(EXAM_PARAM)
+    blueprint = pool.get_or_regenerate(bank, requested_id) if requested_id else None
+    if blueprint is None:
+        blueprint = pool.next()
+    st.session_state.exam_blueprint_id = blueprint.id
+    set_question_list(blueprint.indices)
+
+@st.cache_resource
+def get_answer_analytics():
+    """Süreç genelinde tek bir cevap olay kaydı (ve arka plan yazıcısı) kullanılır."""
+    return AnswerAnalytics(ANALYTICS_DB, refresh_interval=ANALYTICS_REFRESH)
+
+@st.cache_resource
+def get_figure_cache():
+    """Süreç genelinde tek bir şekil önbelleği; dosyalar süreçler arasında da paylaşılır."""
+    return FigureCache(FIGURE_CACHE, FIGURE_CACHE_MB * 1024 * 1024, FIGURE_RENDER_DPI)
+
+@st.cache_resource
+def get_progress_store():
+    """Süreç genelinde tek bir ilerleme deposu (ve arka plan yazıcısı) kullanılır."""
+    return ProgressStore(PROGRESS_DB)
+
+def progress_key(token, bank_id):
+    """Her bankanın ilerlemesi ayrı saklanır; varsayılan banka için anahtar yalnızca belirteçtir."""
+    return token if bank_id == DEFAULT_BANK_ID else f"{token}:{bank_id}"
+
+def restore_session_progress(bank, bank_id):
+    """
+    Oturumun, adres çubuğundaki belirtece ve seçili bankaya ait kayıtlı ilerlemesini geri yükler.
+    Belirteç yoksa yeni bir tane üretilip adrese eklenir; sayfa yenilense veya sunucu
+    yeniden başlasa da aynı adresle ilerleme kaldığı yerden devam eder.
+    """
+    token = st.session_state.get("progress_token") or st.query_params.get(SESSION_TOKEN_PARAM)
+    if not token:
+        token = uuid.uuid4().hex
+        st.query_params[SESSION_TOKEN_PARAM] = token
+    st.session_state.progress_token = token
+    st.session_state.progress_key = progress_key(token, bank_id)
+
+    data = get_progress_store().load(st.session_state.progress_key)
+    if data:
+        restore_progress(st.session_state, data, bank, bank.fingerprint, Scoreboard)
+
+def persist_progress(bank):
+    """Oturumun güncel durumunu yazılmak üzere sıraya alır; disk işlemi arka planda yapılır."""
+    if "progress_key" in st.session_state:
+        get_progress_store().save(st.session_state.progress_key, export_progress(st.session_state, bank.fingerprint))
+
+# Banka değiştiğinde sıfırlanan widget anahtarları (seçenekleri veya sınırları bankaya bağlıdır)
+BANK_WIDGET_KEYS = ("jump_input", "mode_selection", "search_result_choice", "first_attempt_page", "exam_detail_page")
+
+def select_bank(catalog):
+    """
+    Kenar çubuğunda oturumun bankasını seçtirir ve seçilen bankanın kimliğini döndürür.
+    Katalogda tek banka varsa seçim gösterilmez. Seçim adres çubuğunda da taşınır.
+    """
+    if len(catalog) == 1:
+        return next(iter(catalog))
+    if "bank_selection" not in st.session_state:
+        requested = st.query_params.get(BANK_PARAM)
+        st.session_state.bank_selection = requested if requested in catalog else next(iter(catalog))
+    bank_id = st.sidebar.selectbox(
+        "Soru Bankası:",
+        list(catalog),
+        format_func=lambda b: catalog[b].name,
+        key="bank_selection",
+    )
+    if st.query_params.get(BANK_PARAM) != bank_id:
+        st.query_params[BANK_PARAM] = bank_id
+    return bank_id
+
+def switch_bank(bank, bank_id):
+    """
+    Oturumu seçilen bankaya bağlar. Önceki bankanın ilerlemesi zaten kaydedilmiştir;
+    oturum durumu ve bankaya bağlı widget'lar temizlenir, yeni bankanın kaydı geri yüklenir.
+    """
+    if "active_bank_id" in st.session_state:
+        clear_progress(st.session_state)
+        for key in BANK_WIDGET_KEYS:
+            st.session_state.pop(key, None)
+        clear_answer_widgets()
+        for key in ("feedback_trigger", "prev_index"):
+            st.session_state.pop(key, None)
+    st.session_state.active_bank_id = bank_id
+    restore_session_progress(bank, bank_id)
+
+@metrics.timed("sidebar_status")
+def render_status_page(item_count, line_for, key, area=st.sidebar):
+    """
+    Kenar çubuğundaki (veya verilen kapsayıcıdaki) soru durum listesini sayfa sayfa ve tek bir
+    markdown bloğu olarak çizer. Banka ne kadar büyük olursa olsun en fazla iki öğe (sayfa seçici
+    + liste) gönderilir; line_for(i) yalnızca görünen sayfadaki sorular için çağrılır.
+    """
+    page_count = max(1, -(-item_count // STATUS_PAGE_SIZE)) # Yukarı yuvarlanmış bölme
+    page = 0
+    if page_count > 1:
+        page = area.selectbox(
+            "Sayfa:",
+            range(page_count),
+            format_func=lambda p: f"{p * STATUS_PAGE_SIZE + 1}-{min((p + 1) * STATUS_PAGE_SIZE, item_count)}",
+            key=key,
+        )
+    start = page * STATUS_PAGE_SIZE
+    stop = min(start + STATUS_PAGE_SIZE, item_count)
+    # Markdown'da satır sonu için iki boşluk kullanılır
+    area.markdown("  \n".join(line_for(i) for i in range(start, stop)))
+
+def clear_answer_widgets():
+    """Şık radyo düğmelerinin oturumdaki seçimlerini siler."""
+    for key in list(st.session_state):
+        if ANSWER_WIDGET_KEY.fullmatch(key):
+            del st.session_state[key]
+
+def answer_widget_key():
+    """
+    Ekrandaki sorunun radyo düğmesi anahtarı. Aralıklı tekrarda soruya her dönüşte anahtar
+    yenilenir: önceki cevap seçili gelmez ve aynı şık yeniden seçildiğinde de on_change tetiklenir.
+    """
+    if st.session_state.spaced_repetition_active:
+        return f"q{st.session_state.index}_{st.session_state.answer_round}"
+    return f"q{st.session_state.index}"
+
+def set_question_list(indices):
+    """
+    Oturumun çalıştığı soru listesini değiştirir. Radyo düğmesinin anahtarı listedeki konuma,
+    değeri şıkkın konumuna bağlı olduğundan önceki listenin seçimleri de silinir; aksi halde
+    yeni listede aynı konumdaki soru eski seçimle (on_change tetiklenmeden) gösterilirdi.
+    """
+    st.session_state.current_indices = indices
+    clear_answer_widgets()
+
+def advance_to(new_index):
+    """
+    Soru indeksini değiştirir ve önceki sorunun geri bildirimini temizler.
+    Gezinme düğmelerinin on_click callback'i olarak da kullanılır; indeks
+    widget çizilmeden önce değiştiği için ek bir st.rerun() gerekmez.
+    """
+    if 0 <= new_index < len(st.session_state.current_indices):
+        st.session_state.index = new_index
+        st.session_state.prev_index = new_index
+        st.session_state.feedback_trigger = None
+        # Aralıklı tekrarda her gösterim ayrı bir tur sayılır (planlayıcının saati = verilen cevap sayısı)
+        st.session_state.answer_round = st.session_state.scheduler.clock
+
+def handle_jump():
+    advance_to(st.session_state.jump_input - 1)
+
+def next_due_index(exclude=None):
+    """
+    Aralıklı tekrar modunda sıradaki sorunun listedeki konumu.
+    Bu modda liste bankanın tamamıdır, dolayısıyla konum banka indeksine eşittir.
+    """
+    return st.session_state.scheduler.next_question(exclude)
+
+def advance_to_next_due():
+    """Aralıklı tekrar modunda "İleri" düğmesinin callback'i: planlayıcının seçtiği soruya geçer."""
+    advance_to(next_due_index(exclude=st.session_state.current_indices[st.session_state.index]))
+
+# --- on_change callback fonksiyonu ---
+# Bu fonksiyon, st.radio bileşeni her değiştiğinde çağrılır.
+@metrics.timed("handle_option_change")
+def handle_option_change(bank):
+    bank_idx = st.session_state.current_indices[st.session_state.index]
+    soru = bank[bank_idx]
+    question_num = soru.number
+    # Radyo düğmesinin değeri şıkkın konumudur; harf ve doğruluk derlenmiş bankadan sabit zamanda okunur
+    selected_letter = soru.letters[st.session_state[answer_widget_key()]]
+    current_correctness = bank.check(bank_idx, selected_letter) # Anahtar yoksa None
 
     # Kullanıcının mevcut cevabını oturuma kaydet
     st.session_state.user_answers[question_num] = selected_letter
+
+    # Her cevap, anahtarı varsa aralıklı tekrar planlayıcısını da besler (O(log n))
+    if current_correctness is not None:
+        st.session_state.scheduler.record(bank_idx, current_correctness)
+        # Soru istatistikleri için olay kaydı (bellekte O(1) güncelleme, disk yazımı arka planda)
+        if st.session_state.exam_mode_active:
+            first_try = not st.session_state.questions_answered_in_exam.get(question_num, False)
+        else:
+            first_try = question_num not in st.session_state.first_attempt_statuses
+        get_answer_analytics().record(
+            st.session_state.active_bank_id, question_num,
+            "sinav" if st.session_state.exam_mode_active else "alistirma",
+            selected_letter, current_correctness, first_try,
+        )
     
     # Sınav modunda değilsek (Alıştırma Modu)
     if not st.session_state.exam_mode_active:
@@ -126,214 +362,148 @@ def handle_option_change(questions, correct_answers):
         if question_num not in st.session_state.first_attempt_statuses:
             st.session_state.first_attempt_statuses[question_num] = current_correctness
         
-        # question_statuses (anlık durum) her zaman güncellenir
-        st.session_state.question_statuses[question_num] = current_correctness
-
-        # Doğru/Yanlış sayılarını mevcut question_statuses'a göre yeniden hesapla
-        st.session_state.correct_count = sum(1 for status in st.session_state.question_statuses.values() if status is True)
-        st.session_state.incorrect_count = sum(1 for status in st.session_state.question_statuses.values() if status is False)
+        # question_statuses (anlık durum) her zaman güncellenir;
+        # doğru/yanlış sayıları yalnızca bu sorunun eski ve yeni durumuna göre ayarlanır
+        st.session_state.question_statuses.record(question_num, current_correctness)
 
         # Geri bildirim tetikleyicisini ayarla (Alıştırma Modu için)
-        if correct_answer_cleaned is None:
+        if current_correctness is None:
             st.session_state.feedback_trigger = 'no_answer_found'
         elif current_correctness: # Doğru cevap
-            st.session_state.feedback_trigger = 'correct'
+            # Son soru değilse bir sonrakine burada geçilir; ekstra bir st.rerun() gerekmez
+            if st.session_state.spaced_repetition_active:
+                # Sıradaki soru listeden değil, tekrar zamanı gelmiş sorular arasından seçilir
+                advance_to(next_due_index(exclude=bank_idx))
+                st.session_state.feedback_trigger = 'correct_advanced'
+            elif st.session_state.index < len(st.session_state.current_indices) - 1:
+                advance_to(st.session_state.index + 1)
+                st.session_state.feedback_trigger = 'correct_advanced'
+            else:
+                st.session_state.feedback_trigger = 'correct'
         else: # Yanlış cevap
             st.session_state.feedback_trigger = 'incorrect'
     else: # Sınav modunda ise
         # Sınav modunda her soruya bir kez cevap verilebilir
         st.session_state.exam_answers[question_num] = selected_letter # Sınav cevaplarını kaydet
         st.session_state.questions_answered_in_exam[question_num] = True # Sorunun cevaplandığını işaretler
+        # Puanlama cevap anında yapılır; anahtarı olmayan sorular yanlış sayılır
+        st.session_state.exam_scoreboard.record(bank_idx, current_correctness is True)
 
+        # --- Sınav Modu Otomatik İlerleme ---
+        # Son soru değilse bir sonraki soruya doğrudan geçilir (sınavda anlık mesaj gösterilmez)
+        if st.session_state.index < len(st.session_state.current_indices) - 1:
+            advance_to(st.session_state.index + 1)
 
-def main():
-    st.set_page_config(layout="wide", page_title="İSG Sınav Uygulaması")
-
-    st.title("İSG Sınav Uygulaması")
-    st.markdown("---")
-
-    questions_full_list = [] # Tüm soruların listesi
-    correct_answers = {}
 
-    try:
-        with st.spinner("Sorular yükleniyor ve ayrıştırılıyor..."):
-            # Orijinal DOCX parse fonksiyonunu kullan yerine PDF parse fonksiyonlarını çağır
-            questions_full_list = parse_questions_from_pdf(QUESTIONS_FILE)
-        if not questions_full_list:
-            st.error(f"Sorular '{QUESTIONS_FILE}' dosyasından ayrıştırılamadı veya dosya boş. Formatı kontrol edin.")
-            st.stop() # Uygulamayı durdur
-    except Exception as e:
-        st.error(f"Sorular dosyası okunurken bir hata oluştu: {e}. Dosyanın bozuk olmadığından emin olun.")
-        st.stop()
+def jump_to_search_result(bank):
+    """
+    Seçilen arama sonucuna gider. Tam listede sorunun konumu banka indeksine eşittir;
+    filtreli bir listedeyken (ilk deneme kontrolü veya arama listesi) önce tam listeye dönülür.
+    """
+    bank_idx = st.session_state.search_result_choice
+    if bank_idx is None:
+        return
+    if st.session_state.review_mode_active or st.session_state.search_list_active:
+        st.session_state.review_mode_active = False
+        st.session_state.search_list_active = False
+        set_question_list(bank.all_indices())
+    advance_to(bank_idx)
+
+@metrics.timed("admin_view")
+def render_admin_view(bank, bank_id):
+    """Tüm oturumlardaki cevaplardan soru başına zorluk istatistikleri (en zor sorular üstte)."""
+    st.header("Soru İstatistikleri")
+    stats = get_answer_analytics().bank_stats(bank_id)
+    if not stats:
+        st.info("Bu banka için henüz cevap kaydı yok.")
+        return
+
+    rows = []
+    for number, question_stats in stats.items():
+        accuracy = question_stats.first_try_accuracy
+        wrong_letter, wrong_count = question_stats.most_common_wrong
+        q_idx = bank.index_of(number)
+        rows.append({
+            "Soru No": number,
+            "Deneme": question_stats.attempts,
+            "İlk Deneme": question_stats.first_tries,
+            "İlk Denemede Doğru (%)": round(accuracy * 100, 1) if accuracy is not None else None,
+            "En Çok Seçilen Yanlış": wrong_letter.upper() if wrong_letter else "",
+            "Yanlış Seçim Sayısı": wrong_count,
+            "Soru": bank[q_idx].question[:80] if q_idx is not None else "",
+        })
+    rows.sort(key=lambda r: (r["İlk Denemede Doğru (%)"] is None, r["İlk Denemede Doğru (%)"] or 0))
+    st.caption(f"{len(rows)} soru, toplam {sum(r['Deneme'] for r in rows)} cevap")
+    st.dataframe(rows, hide_index=True)
 
+def render_question_figure(soru):
+    """Sorunun şeklini kaynak PDF'ten kırpılmış görüntü olarak gösterir (önbellekte yoksa bir kez çizilir)."""
+    figures_path = get_bank_catalog()[st.session_state.active_bank_id].figures_path
     try:
-        with st.spinner("Cevaplar yükleniyor ve ayrıştırılıyor..."):
-            correct_answers = parse_correct_answers_from_pdf(ANSWERS_FILE)
-        if not correct_answers:
-            st.error(f"Cevaplar '{ANSWERS_FILE}' dosyasından ayrıştırılamadı veya dosya boş. Formatı kontrol edin.")
-            st.stop() # Uygulamayı durdur
-    except Exception as e:
-        st.error(f"Cevaplar dosyası okunurken bir hata oluştu: {e}. Dosyanın bozuk olmadığından emin olun.")
-        st.stop()
-
-    # Oturum durumu başlatma
-    if "index" not in st.session_state:
-        st.session_state.index = 0
-    if "user_answers" not in st.session_state: 
-        st.session_state.user_answers = {}
-    if "question_statuses" not in st.session_state: 
-        st.session_state.question_statuses = {} 
-    if "first_attempt_statuses" not in st.session_state: 
-        st.session_state.first_attempt_statuses = {} 
-    if "correct_count" not in st.session_state: 
-        st.session_state.correct_count = 0
-    if "incorrect_count" not in st.session_state: 
-        st.session_state.incorrect_count = 0
-    if "feedback_trigger" not in st.session_state: 
-        st.session_state.feedback_trigger = None
-    if "review_mode_active" not in st.session_state: 
-        st.session_state.review_mode_active = False
-    if "current_question_list" not in st.session_state: 
-        st.session_state.current_question_list = questions_full_list # Başlangıçta tüm sorular
-    if "prev_index" not in st.session_state: 
-        st.session_state.prev_index = st.session_state.index
+        with metrics.span("question_figure"):
+            image = get_figure_cache().get(figures_path, soru.region)
+    except (OSError, RuntimeError, ValueError):
+        st.caption("Bu sorunun şekli kaynak dosyadan yüklenemedi.")
+        return
+    st.image(image)
+
+def is_profiled_session():
+    """ISG_PROFILE_SESSION ile seçilen oturum mu? (cProfile yalnızca bu oturum için açılır)"""
+    return metrics.PROFILE_SESSION is not None and st.session_state.get("progress_token") == metrics.PROFILE_SESSION
+
+@st.fragment
+def render_question_panel(bank, stats_area, status_area):
+    """
+    Soru atlama, gezinme, soru/şıklar ve ilerleme çubuğunu çizer.
+    Fragment olarak çalıştığı için cevap verme ve gezinme yalnızca bu paneli yeniden
+    çalıştırır; kenar çubuğu ve mod seçimi tekrar çalışmaz. Cevaplarla değişen sayaçlar ve
+    ilk deneme listesi, kenar çubuğunda ana çalıştırmanın açtığı kapsayıcılara bu fragment
+    tarafından yazılır ve her cevapta yerinde yenilenir. Sınav bitirme gibi sayfa
+    düzenini değiştiren işlemler st.rerun(scope="app") ile tüm sayfayı yeniler.
+    """
+    with metrics.script_run("fragment", st.session_state, profile=is_profiled_session()):
+        draw_question_panel(bank)
+        draw_answer_counters(bank, stats_area, status_area)
+
+def draw_answer_counters(bank, stats_area, status_area):
+    """Kenar çubuğundaki cevap sayaçları ve (alıştırmada) ilk deneme durum listesi."""
+    if st.session_state.exam_mode_active:
+        if not st.session_state.exam_submitted:
+            answered_count = len(st.session_state.questions_answered_in_exam)
+            stats_area.info(f"**Cevaplanan Soru:** {answered_count}/{len(st.session_state.current_indices)}")
+        return
+
+    stats_area.info(f"**Doğru Cevaplar (Anlık):** {st.session_state.question_statuses.correct}")
+    stats_area.warning(f"**Yanlış Cevaplar (Anlık):** {st.session_state.question_statuses.incorrect}")
+
+    # Cevaplanmış soruları ve durumlarını göster (ilk denemeye göre, sadece Alıştırma Modunda)
+    def first_attempt_line(i):
+        q_num = bank[i].number
+        first_attempt_status = st.session_state.first_attempt_statuses.get(q_num)
+        
+        if first_attempt_status is not None: 
+            status_emoji = "✅" if first_attempt_status is True else "❌"
+        else: 
+            status_emoji = "⚪"
+        return f"{i + 1}. Soru ({q_num}): {status_emoji}"
 
-    # --- Sınav Modu için Yeni Oturum Değişkenleri ---
-    if "exam_mode_active" not in st.session_state:
-        st.session_state.exam_mode_active = False # Varsayılan: Alıştırma Modu
-    if "exam_submitted" not in st.session_state:
-        st.session_state.exam_submitted = False # Sınav bitirildi mi?
-    if "exam_answers" not in st.session_state:
-        st.session_state.exam_answers = {} # Sınav modundaki kullanıcının cevapları
-    if "questions_answered_in_exam" not in st.session_state:
-        st.session_state.questions_answered_in_exam = {} # Sınav modunda cevaplanan soruları işaretler
-    if "exam_results" not in st.session_state:
-        st.session_state.exam_results = None # Sınav sonuçları
-    # Yeni eklendi: Sınav sonrası yanlışları inceleme modu
-    if "review_exam_incorrect_active" not in st.session_state:
-        st.session_state.review_exam_incorrect_active = False
-    if "exam_incorrect_questions_for_review" not in st.session_state: # Sınavda yanlış yapılan sorular
-        st.session_state.exam_incorrect_questions_for_review = []
+    render_status_page(len(bank), first_attempt_line, key="first_attempt_page", area=status_area)
 
+def draw_question_panel(bank):
+    # Oturumdaki güncel liste yalnızca banka indekslerinden oluşur
+    current_indices = st.session_state.current_indices
+    question_count = len(current_indices)
 
     # Eğer soru değiştiyse feedback'i sıfırla
     if st.session_state.index != st.session_state.prev_index:
         st.session_state.feedback_trigger = None
         st.session_state.prev_index = st.session_state.index
 
-    # --- Mod Seçimi ---
-    st.sidebar.header("Mod Seçimi")
-    mode = st.sidebar.radio(
-        "Lütfen bir mod seçin:",
-        ("Alıştırma Modu", "Sınav Modu"),
-        key="mode_selection",
-        index=0 if not st.session_state.exam_mode_active else 1 # Modu session state'e göre ayarla
-    )
-
-    if mode == "Sınav Modu" and not st.session_state.exam_mode_active:
-        # Sınav moduna geçiş yapılıyorsa durumu sıfırla ve soruları karıştır
-        st.session_state.exam_mode_active = True
-        st.session_state.exam_submitted = False
-        st.session_state.exam_answers = {}
-        st.session_state.questions_answered_in_exam = {}
-        st.session_state.exam_results = None
-        st.session_state.index = 0
-        st.session_state.feedback_trigger = None # Mesajı temizle
-        st.session_state.review_exam_incorrect_active = False # Sınav inceleme modunu kapat
-
-        # Rastgele 20 soru seç (veya toplam soru sayısı 20'den azsa hepsini)
-        num_exam_questions = min(20, len(questions_full_list))
-        st.session_state.current_question_list = random.sample(questions_full_list, num_exam_questions)
-        st.rerun() # Mod değişikliğini uygulamak için yeniden çalıştır
-    elif mode == "Alıştırma Modu" and st.session_state.exam_mode_active:
-        # Alıştırma moduna geçiş yapılıyorsa durumu sıfırla ve tüm sorulara dön
-        st.session_state.exam_mode_active = False
-        st.session_state.exam_submitted = False
-        st.session_state.exam_answers = {}
-        st.session_state.questions_answered_in_exam = {}
-        st.session_state.exam_results = None
-        st.session_state.index = 0
-        st.session_state.feedback_trigger = None # Mesajı temizle
-        st.session_state.user_answers = {} # Alıştırma modu cevaplarını temizle
-        st.session_state.question_statuses = {} # Alıştırma modu durumlarını temizle
-        st.session_state.first_attempt_statuses = {} # İlk deneme durumlarını temizle
-        st.session_state.correct_count = 0
-        st.session_state.incorrect_count = 0
-        st.session_state.review_exam_incorrect_active = False # Sınav inceleme modunu kapat
-
-        st.session_state.current_question_list = questions_full_list
-        st.rerun() # Mod değişikliğini uygulamak için yeniden çalıştır
-
-    # --- Sınav Sonuçları Ekranı ---
-    # Bu blok, sadece sınav modundayken ve sınav bitirildiğinde çalışır
-    # Ancak inceleme modunda değilken (çünkü o zaman soru gösterim bloğuna geçeceğiz).
-    if st.session_state.exam_mode_active and st.session_state.exam_submitted and not st.session_state.review_exam_incorrect_active:
-        st.header("Sınav Sonuçlarınız")
-        if st.session_state.exam_results:
-            results = st.session_state.exam_results
-            st.metric(label="Doğru Cevap Sayısı", value=results['correct'])
-            st.metric(label="Yanlış Cevap Sayısı", value=results['incorrect'])
-            st.metric(label="Boş Bırakılan Soru Sayısı", value=results['unanswered'])
-            st.metric(label="Başarı Yüzdesi", value=f"{results['percentage']:.2f}%")
-            
-            # Yanlışları inceleme butonu
-            if st.session_state.exam_incorrect_questions_for_review:
-                if st.sidebar.button("Yanlış Cevapları İncele", key="review_exam_incorrect_button"):
-                    st.session_state.review_exam_incorrect_active = True
-                    st.session_state.current_question_list = st.session_state.exam_incorrect_questions_for_review
-                    st.session_state.index = 0 # İlk yanlış soruya git
-                    st.session_state.feedback_trigger = None # Mesajı temizle
-                    st.rerun()
-            else:
-                st.sidebar.info("Tebrikler! Bu sınavda yanlış cevabınız yok.")
-
-            if st.sidebar.button("Yeni Sınav Başlat", key="new_exam_button_results"):
-                st.session_state.exam_mode_active = True 
-                st.session_state.exam_submitted = False
-                st.session_state.exam_answers = {}
-                st.session_state.questions_answered_in_exam = {}
-                st.session_state.exam_results = None
-                st.session_state.index = 0
-                st.session_state.feedback_trigger = None
-                st.session_state.review_exam_incorrect_active = False 
-                st.session_state.exam_incorrect_questions_for_review = [] 
-
-                num_exam_questions = min(20, len(questions_full_list))
-                st.session_state.current_question_list = random.sample(questions_full_list, num_exam_questions)
-                st.rerun()
-            
-            st.sidebar.markdown("---")
-            st.sidebar.header("Sınav Cevaplarınızın Detayı")
-            for q_idx, q_exam in enumerate(st.session_state.current_question_list):
-                q_num = q_exam['number']
-                user_ans = st.session_state.exam_answers.get(q_num, "Boş")
-                
-                correct_ans = correct_answers.get(q_num, None)
-                correct_ans_cleaned = correct_ans.strip().upper() if correct_ans else "Yok"
-                
-                user_ans_display = user_ans.upper() if user_ans != "Boş" else "Boş"
-
-                status_emoji = "❓"
-                if user_ans != "Boş":
-                    if user_ans.lower() == correct_ans_cleaned.lower():
-                        status_emoji = "✅"
-                    else:
-                        status_emoji = "❌"
-                
-                st.sidebar.markdown(f"**{q_idx + 1}. ({q_num}):** Seçim: {user_ans_display} | Doğru: {correct_ans_cleaned} {status_emoji}")
-            
-        return # Sınav bitince ve inceleme modunda değilken diğer UI öğelerini gösterme
-
-    # questions değişkenini her zaman güncel tut
-    questions = st.session_state.current_question_list
-    question_count = len(questions)
-
-
     # Soru atlama mekanizması
     st.markdown("---")
     col_jump1, col_jump2, col_jump3 = st.columns([2, 1, 2])
     with col_jump1:
-        jump_number = st.number_input(
+        st.number_input(
             "Gitmek İstediğiniz Soru Numarası:",
             min_value=1,
             max_value=question_count,
@@ -342,151 +512,127 @@ def main():
         )
     with col_jump2:
         st.markdown("<br>", unsafe_allow_html=True)
-        if st.button("Atla", key="jump_button"):
-            new_index = jump_number - 1
-            if 0 <= new_index < question_count:
-                st.session_state.index = new_index
-                st.rerun()
+        st.button("Atla", key="jump_button", on_click=handle_jump)
 
     # Navigasyon butonları
     col_nav1, col_nav2, col_nav3 = st.columns([1, 2, 1])
     with col_nav1:
         # Sadece indeks 0'daysa "Geri" butonu devre dışı kalır
-        if st.button("⟵ Geri", key="prev_button", disabled=st.session_state.index <= 0) and st.session_state.index > 0:
-            st.session_state.index -= 1
-            st.rerun()
+        st.button("⟵ Geri", key="prev_button", disabled=st.session_state.index <= 0,
+                  on_click=advance_to, args=(st.session_state.index - 1,))
     with col_nav3:
-        # Sadece son sorudaysa "İleri" butonu devre dışı kalır
-        if st.button("İleri ⟶", key="next_button", disabled=st.session_state.index >= question_count - 1) and st.session_state.index < question_count - 1:
-            st.session_state.index += 1
-            st.rerun()
+        if st.session_state.spaced_repetition_active:
+            # Aralıklı tekrarda "İleri" tekrar zamanı gelmiş sıradaki soruya gider
+            st.button("İleri ⟶", key="next_button", disabled=question_count <= 1, on_click=advance_to_next_due)
+        else:
+            # Sadece son sorudaysa "İleri" butonu devre dışı kalır
+            st.button("İleri ⟶", key="next_button", disabled=st.session_state.index >= question_count - 1,
+                      on_click=advance_to, args=(st.session_state.index + 1,))
 
     st.markdown("---")
 
     # Mevcut soruyu göster
-    if questions: 
-        soru = questions[st.session_state.index]
+    if question_count: 
+        bank_idx = current_indices[st.session_state.index]
+        soru = bank[bank_idx]
         
         # Soru başlığı ve metnini moda göre farklı şekilde göster
         # Soru numarası her zaman görünmeli
-        st.subheader(f"{st.session_state.index + 1}. Soru (Soru No: {soru['number']})") 
+        st.subheader(f"{st.session_state.index + 1}. Soru (Soru No: {soru.number})") 
         
         # Soru metnini ise moda göre biçimlendir
         # Eğer inceleme modundaysak soru metnini daha belirgin göster
         if st.session_state.review_exam_incorrect_active:
-            st.markdown(f"### **{soru['question']}**") 
+            st.markdown(f"### **{soru.question}**") 
         else: # Diğer modlarda (Alıştırma, Sınav) normal başlık ve metin
-            st.markdown(f"**{soru['question']}**")
+            st.markdown(f"**{soru.question}**")
+
+        # Şekilli sorularda kaynak PDF'teki şekil (işaret, tablo, çizim) de gösterilir
+        if soru.has_figure:
+            render_question_figure(soru)
 
         feedback_message_area = st.empty()
 
+        # Daha önce verilen cevap ön seçili getirilir; harfin şık konumu bankadaki haritadan okunur
         pre_selected_index = None
-        # Eğer Alıştırma modundaysak ve kontrol modunda değilsek, daha önce verilen cevabı ön seçili getir
-        if not st.session_state.exam_mode_active and not st.session_state.review_mode_active and soru["number"] in st.session_state.user_answers:
-            for i, opt_text in enumerate(soru['options']):
-                if opt_text and len(opt_text) > 0 and opt_text[0].lower() == st.session_state.user_answers[soru["number"]]:
-                    pre_selected_index = i
-                    break
-        # Sınav modundaysak (veya sınav inceleme modundaysak), ilgili cevabı ön seçili getir
-        elif st.session_state.exam_mode_active and (soru["number"] in st.session_state.exam_answers):
-             # Sınav modunda veya sınav inceleme modunda aynı mantığı kullan
-             for i, opt_text in enumerate(soru['options']):
-                if opt_text and len(opt_text) > 0 and opt_text[0].lower() == st.session_state.exam_answers[soru["number"]]:
-                    pre_selected_index = i
-                    break
+        # Eğer Alıştırma modundaysak ve kontrol veya aralıklı tekrar modunda değilsek, alıştırma cevabı
+        # (tekrar zamanı gelen soruda önceki cevabı göstermek doğru şıkkı ele verirdi)
+        if not st.session_state.exam_mode_active and not st.session_state.review_mode_active and \
+           not st.session_state.spaced_repetition_active and soru.number in st.session_state.user_answers:
+            pre_selected_index = soru.option_index.get(st.session_state.user_answers[soru.number])
+        # Sınav modundaysak (veya sınav inceleme modundaysak), sınav cevabı
+        elif st.session_state.exam_mode_active and (soru.number in st.session_state.exam_answers):
+            pre_selected_index = soru.option_index.get(st.session_state.exam_answers[soru.number])
 
         # Şıklar devre dışı bırakılacak mı?
         # Sınav modunda cevaplandıysa VEYA sınav inceleme modundaysak devre dışı
-        is_radio_disabled = (st.session_state.exam_mode_active and st.session_state.questions_answered_in_exam.get(soru['number'], False)) or \
+        is_radio_disabled = (st.session_state.exam_mode_active and st.session_state.questions_answered_in_exam.get(soru.number, False)) or \
                             st.session_state.review_exam_incorrect_active
 
+        # Değer şıkkın konumudur, ekranda şık metni gösterilir
         selected_option = st.radio(
             "Şıkları seçin:",
-            soru['options'],
-            key=f"q{st.session_state.index}", 
+            range(len(soru.options)),
+            format_func=soru.options.__getitem__,
+            key=answer_widget_key(), 
             index=pre_selected_index, 
             on_change=handle_option_change, 
-            args=(questions, correct_answers),
+            args=(bank,),
             disabled=is_radio_disabled # Şıkları devre dışı bırak
         )
 
         # Sınav inceleme modunda ekstra bilgi göster (şimdi sadece cevapları gösterecek)
         if st.session_state.review_exam_incorrect_active:
             st.markdown("---") # Ayırıcı çizgi
-            user_ans = st.session_state.exam_answers.get(soru['number'], "Boş")
-            correct_ans = correct_answers.get(soru['number'], None)
+            user_ans = st.session_state.exam_answers.get(soru.number)
+            correct_ans = bank.correct_letter(bank_idx)
             correct_ans_display = correct_ans.upper() if correct_ans else "Yok"
             
-            st.markdown(f"**Sizin Cevabınız:** {user_ans.upper() if user_ans != 'Boş' else 'Boş'} {'❌' if user_ans and correct_ans and user_ans.lower() != correct_ans.lower() else ''}")
+            st.markdown(f"**Sizin Cevabınız:** {user_ans.upper() if user_ans else 'Boş'} {'❌' if user_ans and correct_ans and user_ans != correct_ans else ''}")
             st.markdown(f"**Doğru Cevap:** {correct_ans_display} ✅")
             st.markdown(f"---")
             
             if st.button("Sınav Sonuçlarına Geri Dön", key="back_to_exam_results_review"):
                 st.session_state.review_exam_incorrect_active = False
                 st.session_state.exam_submitted = True # Tekrar sonuç ekranına dön
+                set_question_list(st.session_state.exam_indices) # Sınav listesine geri dön
                 st.session_state.index = 0 # İndeksi sıfırla, sonuç ekranı tekrar yüklenecek
-                st.rerun()
+                st.rerun(scope="app")
 
         # Geri bildirim mesajları (Sadece Alıştırma Modu için aktif)
         if not st.session_state.exam_mode_active and not st.session_state.review_exam_incorrect_active:
-            if st.session_state.feedback_trigger == 'correct':
-                feedback_message_area.success("✅ Doğru cevap!")
-                if st.session_state.index < question_count - 1:
-                    st.session_state.index += 1
-                    st.session_state.feedback_trigger = None 
-                    st.rerun() 
-                else:
-                    st.balloons() 
-                    feedback_message_area.success("Tebrikler, tüm soruları bitirdiniz!")
-                    st.session_state.feedback_trigger = None 
+            if st.session_state.feedback_trigger == 'correct_advanced':
+                # Önceki soru doğru cevaplandı ve callback bu soruya geçirdi
+                feedback_message_area.success("✅ Doğru cevap! Sonraki soruya geçildi.")
+                st.session_state.feedback_trigger = None 
+
+            elif st.session_state.feedback_trigger == 'correct': # Son soru doğru cevaplandı
+                st.balloons() 
+                feedback_message_area.success("Tebrikler, tüm soruları bitirdiniz!")
+                st.session_state.feedback_trigger = None 
 
             elif st.session_state.feedback_trigger == 'incorrect':
                 feedback_message_area.error("❌ Yanlış cevap!") 
             
             elif st.session_state.feedback_trigger == 'no_answer_found':
-                feedback_message_area.warning(f"Soru {soru['number']} için doğru cevap bulunamadı. Lütfen cevaplar.txt dosyasını kontrol edin.")
+                feedback_message_area.warning(f"Soru {soru.number} için doğru cevap bulunamadı. Lütfen cevaplar.txt dosyasını kontrol edin.")
                 st.session_state.feedback_trigger = None 
             else: 
                 feedback_message_area.empty()
         
-        # --- Sınav Modu Otomatik İlerleme ---
-        # Sınav modundayız, mevcut soru cevaplandı mı ve henüz son soru değil mi?
-        # Ve sınav inceleme modunda değilsek
-        if st.session_state.exam_mode_active and \
-           st.session_state.questions_answered_in_exam.get(soru['number'], False) and \
-           st.session_state.index < question_count - 1 and \
-           not st.session_state.review_exam_incorrect_active: 
-            
-            feedback_message_area.empty() # Sınav modunda anlık metinsel mesaj göstermiyoruz
-            st.session_state.index += 1 # Bir sonraki soruya geç
-            st.rerun() # Yeni soruyu yükle ve UI'ı güncelle
-
         # Sınavı Bitir butonu (Sınav modunda ve son sorudaysak veya tüm sorular cevaplanmışsa)
         if st.session_state.exam_mode_active and \
            not st.session_state.review_exam_incorrect_active and \
            (st.session_state.index == question_count - 1 or len(st.session_state.questions_answered_in_exam) == question_count):
             if st.button("Sınavı Bitir", key="submit_exam_button"):
-                # Sınav sonuçlarını hesapla
-                exam_correct = 0
-                exam_incorrect = 0
-                exam_unanswered = 0
-                
-                st.session_state.exam_incorrect_questions_for_review = [] # Her sınav bitişinde sıfırla
-
-                for q_exam in st.session_state.current_question_list:
-                    q_num = q_exam['number']
-                    user_ans = st.session_state.exam_answers.get(q_num, None)
-                    correct_ans = correct_answers.get(q_num, None)
-                    
-                    if user_ans is None:
-                        exam_unanswered += 1
-                    elif correct_ans and user_ans.lower().strip().replace('\ufeff', '') == correct_ans.lower().strip().replace('\ufeff', ''):
-                        exam_correct += 1
-                    else:
-                        exam_incorrect += 1
-                        st.session_state.exam_incorrect_questions_for_review.append(q_exam) # Yanlış yapılanı listeye ekle
-                
-                total_questions = len(st.session_state.current_question_list)
+                # Sınav sonuçları cevaplar verilirken tutulan puan tablosundan okunur
+                exam_scoreboard = st.session_state.exam_scoreboard
+                exam_correct = exam_scoreboard.correct
+                exam_incorrect = exam_scoreboard.incorrect
+                total_questions = len(current_indices)
+                exam_unanswered = total_questions - len(exam_scoreboard)
+
+                st.session_state.exam_incorrect_indices = bank.indices(exam_scoreboard.incorrect_keys)
                 percentage = (exam_correct / total_questions) * 100 if total_questions > 0 else 0
 
                 st.session_state.exam_results = {
@@ -496,7 +642,7 @@ def main():
                     "percentage": percentage
                 }
                 st.session_state.exam_submitted = True
-                st.rerun() # Sonuçları göstermek için yeniden çalıştır
+                st.rerun(scope="app") # Sonuç ekranı ve kenar çubuğu için tüm sayfayı yeniden çalıştır
 
     else: # questions listesi boşsa
         st.info("Gösterilecek soru bulunmuyor. Lütfen dosya yükleyin veya 'Tüm Sorulara Dön' butonunu kullanın.")
@@ -515,61 +661,317 @@ def main():
         progress_bar_value = (st.session_state.index + 1) / question_count
     else: # Alıştırma Modu veya Sınav bitmişse
         progress_bar_value = (st.session_state.index + 1) / question_count
-        st.caption(f"**İlerleme: {st.session_state.index + 1}/{question_count}**")
+        st.caption(f"**İlerleme: {st.session_state.index + 1}/{question_count}** | "
+                   f"✅ {st.session_state.question_statuses.correct} | ❌ {st.session_state.question_statuses.incorrect}")
 
     progress = st.progress(progress_bar_value)
 
+    # Her panel çalışmasından sonra ilerleme arka planda kaydedilir
+    persist_progress(bank)
+
+def main():
+    st.set_page_config(layout="wide", page_title="İSG Sınav Uygulaması")
+
+    st.title("İSG Sınav Uygulaması")
+    st.markdown("---")
+
+    try:
+        catalog = get_bank_catalog()
+    except (OSError, ValueError, KeyError) as e:
+        st.error(f"Banka kataloğu '{BANK_CATALOG}' okunamadı: {e}")
+        st.stop()
+    bank_id = select_bank(catalog)
+    spec = catalog[bank_id]
+
+    try:
+        with st.spinner("Sorular ve cevaplar yükleniyor..."):
+            # Derlenmiş banka varsa PDF ayrıştırması atlanır; banka tüm oturumlarca paylaşılır
+            bank = get_question_bank(spec.questions_path, spec.answers_path, spec.figures_path,
+                                     source_fingerprint(*spec.sources))
+            # Arama indeksi de banka yüklenirken kurulur; ilk arama beklemez
+            get_search_index(bank, bank.fingerprint)
+    except Exception as e:
+        st.error(f"Soru veya cevap dosyası okunurken bir hata oluştu: {e}. Dosyaların bozuk olmadığından emin olun.")
+        st.stop()
+
+    if not len(bank):
+        st.error(f"Sorular '{spec.questions_path}' dosyasından ayrıştırılamadı veya dosya boş. Formatı kontrol edin.")
+        st.stop() # Uygulamayı durdur
+    if not bank.answer_count:
+        st.error(f"Cevaplar '{spec.answers_path}' dosyasından ayrıştırılamadı veya dosya boş. Formatı kontrol edin.")
+        st.stop() # Uygulamayı durdur
+
+    # Yönetici görünümü yalnızca istatistikleri gösterir; oturum ilerlemesi yüklenmez
+    if ADMIN_KEY and st.query_params.get(ADMIN_PARAM) == ADMIN_KEY:
+        render_admin_view(bank, bank_id)
+        return
+
+    # Yeni oturumsa veya banka değiştiyse kayıtlı ilerlemeyi geri yükle
+    # (eksik kalan alanlar aşağıda varsayılanlarla doldurulur)
+    if st.session_state.get("active_bank_id") != bank_id:
+        switch_bank(bank, bank_id)
+
+    # Oturum durumu başlatma
+    if "index" not in st.session_state:
+        st.session_state.index = 0
+    if "user_answers" not in st.session_state: 
+        st.session_state.user_answers = {}
+    if "question_statuses" not in st.session_state: 
+        st.session_state.question_statuses = Scoreboard() # Anlık durumlar ve doğru/yanlış sayıları
+    if "first_attempt_statuses" not in st.session_state: 
+        st.session_state.first_attempt_statuses = {} 
+    if "feedback_trigger" not in st.session_state: 
+        st.session_state.feedback_trigger = None
+    if "review_mode_active" not in st.session_state: 
+        st.session_state.review_mode_active = False
+    if "current_indices" not in st.session_state: 
+        st.session_state.current_indices = bank.all_indices() # Başlangıçta tüm sorular (yalnızca indeksler)
+    if "prev_index" not in st.session_state: 
+        st.session_state.prev_index = st.session_state.index
+
+    # --- Sınav Modu için Yeni Oturum Değişkenleri ---
+    if "exam_mode_active" not in st.session_state:
+        st.session_state.exam_mode_active = False # Varsayılan: Alıştırma Modu
+    if "exam_submitted" not in st.session_state:
+        st.session_state.exam_submitted = False # Sınav bitirildi mi?
+    if "exam_answers" not in st.session_state:
+        st.session_state.exam_answers = {} # Sınav modundaki kullanıcının cevapları
+    if "questions_answered_in_exam" not in st.session_state:
+        st.session_state.questions_answered_in_exam = {} # Sınav modunda cevaplanan soruları işaretler
+    if "exam_scoreboard" not in st.session_state:
+        st.session_state.exam_scoreboard = Scoreboard() # Sınav puanı, banka indeksine göre
+    if "exam_results" not in st.session_state:
+        st.session_state.exam_results = None # Sınav sonuçları
+    # Yeni eklendi: Sınav sonrası yanlışları inceleme modu
+    if "review_exam_incorrect_active" not in st.session_state:
+        st.session_state.review_exam_incorrect_active = False
+    if "exam_incorrect_indices" not in st.session_state: # Sınavda yanlış yapılan soruların indeksleri
+        st.session_state.exam_incorrect_indices = bank.indices(())
+
+    # --- Aralıklı Tekrar ---
+    if "scheduler" not in st.session_state or st.session_state.scheduler.question_count != len(bank):
+        st.session_state.scheduler = LeitnerScheduler(len(bank)) # Kullanıcıya özel tekrar sırası (heap)
+    if "spaced_repetition_active" not in st.session_state:
+        st.session_state.spaced_repetition_active = False
+    if "answer_round" not in st.session_state: # Aralıklı tekrarda radyo düğmesi anahtarının tur bileşeni
+        st.session_state.answer_round = st.session_state.scheduler.clock
+    if "search_list_active" not in st.session_state: # Arama sonuçlarından oluşturulan liste ile çalışılıyor mu?
+        st.session_state.search_list_active = False
+
+
+    # Geri yüklenen liste kısalmışsa geçersiz konumdan başa dön
+    if st.session_state.index >= len(st.session_state.current_indices):
+        st.session_state.index = 0
+        st.session_state.prev_index = 0
+
+    # --- Mod Seçimi ---
+    st.sidebar.header("Mod Seçimi")
+    mode = st.sidebar.radio(
+        "Lütfen bir mod seçin:",
+        ("Alıştırma Modu", "Sınav Modu"),
+        key="mode_selection",
+        index=0 if not st.session_state.exam_mode_active else 1 # Modu session state'e göre ayarla
+    )
+
+    if mode == "Sınav Modu" and not st.session_state.exam_mode_active:
+        with metrics.span("mode_switch", to="exam"):
+            # Sınav moduna geçiş yapılıyorsa durumu sıfırla ve soruları karıştır
+            st.session_state.exam_mode_active = True
+            st.session_state.exam_submitted = False
+            st.session_state.exam_answers = {}
+            st.session_state.questions_answered_in_exam = {}
+            st.session_state.exam_scoreboard = Scoreboard()
+            st.session_state.exam_results = None
+            st.session_state.index = 0
+            st.session_state.feedback_trigger = None # Mesajı temizle
+            st.session_state.review_exam_incorrect_active = False # Sınav inceleme modunu kapat
+            st.session_state.spaced_repetition_active = False # Aralıklı tekrar yalnızca alıştırmada kullanılır
+            st.session_state.search_list_active = False
+
+            # Önceden üretilmiş, katmanlı bir sınav kalıbı ata
+            start_exam(bank)
+            st.rerun() # Mod değişikliğini uygulamak için yeniden çalıştır
+    elif mode == "Alıştırma Modu" and st.session_state.exam_mode_active:
+        with metrics.span("mode_switch", to="practice"):
+            # Alıştırma moduna geçiş yapılıyorsa durumu sıfırla ve tüm sorulara dön
+            st.session_state.exam_mode_active = False
+            st.session_state.exam_submitted = False
+            st.session_state.exam_answers = {}
+            st.session_state.questions_answered_in_exam = {}
+            st.session_state.exam_scoreboard = Scoreboard()
+            st.session_state.exam_results = None
+            st.session_state.index = 0
+            st.session_state.feedback_trigger = None # Mesajı temizle
+            st.session_state.user_answers = {} # Alıştırma modu cevaplarını temizle
+            st.session_state.question_statuses = Scoreboard() # Alıştırma modu durumlarını ve sayılarını temizle
+            st.session_state.first_attempt_statuses = {} # İlk deneme durumlarını temizle
+            st.session_state.review_exam_incorrect_active = False # Sınav inceleme modunu kapat
+
+            set_question_list(bank.all_indices())
+            st.rerun() # Mod değişikliğini uygulamak için yeniden çalıştır
+
+    # --- Sınav Sonuçları Ekranı ---
+    # Bu blok, sadece sınav modundayken ve sınav bitirildiğinde çalışır
+    # Ancak inceleme modunda değilken (çünkü o zaman soru gösterim bloğuna geçeceğiz).
+    if st.session_state.exam_mode_active and st.session_state.exam_submitted and not st.session_state.review_exam_incorrect_active:
+        st.header("Sınav Sonuçlarınız")
+        if st.session_state.get("exam_blueprint_id"):
+            st.caption(f"Sınav kodu: {st.session_state.exam_blueprint_id}")
+        if st.session_state.exam_results:
+            results = st.session_state.exam_results
+            st.metric(label="Doğru Cevap Sayısı", value=results['correct'])
+            st.metric(label="Yanlış Cevap Sayısı", value=results['incorrect'])
+            st.metric(label="Boş Bırakılan Soru Sayısı", value=results['unanswered'])
+            st.metric(label="Başarı Yüzdesi", value=f"{results['percentage']:.2f}%")
+            
+            # Yanlışları inceleme butonu
+            if st.session_state.exam_incorrect_indices:
+                if st.sidebar.button("Yanlış Cevapları İncele", key="review_exam_incorrect_button"):
+                    st.session_state.review_exam_incorrect_active = True
+                    st.session_state.exam_indices = st.session_state.current_indices # Sonuç ekranı için sınav listesini sakla
+                    set_question_list(st.session_state.exam_incorrect_indices)
+                    st.session_state.index = 0 # İlk yanlış soruya git
+                    st.session_state.feedback_trigger = None # Mesajı temizle
+                    st.rerun()
+            else:
+                st.sidebar.info("Tebrikler! Bu sınavda yanlış cevabınız yok.")
+
+            if st.sidebar.button("Yeni Sınav Başlat", key="new_exam_button_results"):
+                st.session_state.exam_mode_active = True 
+                st.session_state.exam_submitted = False
+                st.session_state.exam_answers = {}
+                st.session_state.questions_answered_in_exam = {}
+                st.session_state.exam_scoreboard = Scoreboard()
+                st.session_state.exam_results = None
+                st.session_state.index = 0
+                st.session_state.feedback_trigger = None
+                st.session_state.review_exam_incorrect_active = False 
+                st.session_state.exam_incorrect_indices = bank.indices(()) 
+
+                start_exam(bank)
+                st.rerun()
+            
+            st.sidebar.markdown("---")
+            st.sidebar.header("Sınav Cevaplarınızın Detayı")
+            exam_indices = st.session_state.current_indices
+
+            def exam_detail_line(q_idx):
+                # Cevaplar kaydedilirken normalleştirildiği için karşılaştırma anahtar dizisinden yapılır
+                bank_idx = exam_indices[q_idx]
+                q_num = bank[bank_idx].number
+                user_ans = st.session_state.exam_answers.get(q_num)
+                correct_ans = bank.correct_letter(bank_idx)
+
+                status_emoji = "❓"
+                if user_ans is not None:
+                    status_emoji = "✅" if bank.check(bank_idx, user_ans) else "❌"
+                
+                return (f"**{q_idx + 1}. ({q_num}):** Seçim: {user_ans.upper() if user_ans else 'Boş'} | "
+                        f"Doğru: {correct_ans.upper() if correct_ans else 'Yok'} {status_emoji}")
+
+            render_status_page(len(exam_indices), exam_detail_line, key="exam_detail_page")
+            
+        persist_progress(bank)
+        return # Sınav bitince ve inceleme modunda değilken diğer UI öğelerini gösterme
 
     # Genel İstatistikler (Moda göre değişir)
+    # Cevaplarla değişen sayaçları soru paneli yazar; kapsayıcılar burada, kenar çubuğundaki yerlerinde açılır
     st.sidebar.markdown("---")
-    st.sidebar.header("İstatistikler")
+    stats_area = st.sidebar.container()
+    stats_area.header("İstatistikler")
+    status_area = None
+    if st.session_state.exam_mode_active and st.session_state.get("exam_blueprint_id"):
+        # Sınav kodu ile aynı sınav daha sonra birebir yeniden üretilebilir
+        stats_area.caption(f"Sınav kodu: {st.session_state.exam_blueprint_id}")
     
-    if st.session_state.exam_mode_active and not st.session_state.exam_submitted:
-        st.sidebar.info(f"**Cevaplanan Soru:** {len(st.session_state.questions_answered_in_exam)}/{question_count}")
-    elif st.session_state.exam_mode_active and st.session_state.exam_submitted: # Sınav bitmişse ve sonuçlar gösteriliyorsa
-        st.sidebar.info(f"**Toplam Doğru:** {st.session_state.exam_results['correct'] if st.session_state.exam_results else 0}")
-        st.sidebar.warning(f"**Toplam Yanlış:** {st.session_state.exam_results['incorrect'] if st.session_state.exam_results else 0}")
-        st.sidebar.error(f"**Boş:** {st.session_state.exam_results['unanswered'] if st.session_state.exam_results else 0}")
-    else: # Alıştırma Modu
-        st.sidebar.info(f"**Doğru Cevaplar (Anlık):** {st.session_state.correct_count}")
-        st.sidebar.warning(f"**Yanlış Cevaplar (Anlık):** {st.session_state.incorrect_count}")
-        
+    if st.session_state.exam_mode_active and st.session_state.exam_submitted: # Sınav bitmişse ve sonuçlar gösteriliyorsa
+        stats_area.info(f"**Toplam Doğru:** {st.session_state.exam_results['correct'] if st.session_state.exam_results else 0}")
+        stats_area.warning(f"**Toplam Yanlış:** {st.session_state.exam_results['incorrect'] if st.session_state.exam_results else 0}")
+        stats_area.error(f"**Boş:** {st.session_state.exam_results['unanswered'] if st.session_state.exam_results else 0}")
+    elif not st.session_state.exam_mode_active: # Alıştırma Modu
         st.sidebar.markdown("---")
         # Kontrol Modu Butonları (Sadece Alıştırma Modunda)
-        if not st.session_state.review_mode_active:
+        if st.session_state.spaced_repetition_active:
+            st.sidebar.caption(f"Aralıklı tekrar: {len(st.session_state.scheduler.due)} soru tekrar sırasında")
+            if st.sidebar.button("Sıralı Listeye Dön", key="exit_spaced_button"):
+                st.session_state.spaced_repetition_active = False
+                st.session_state.index = 0
+                st.session_state.feedback_trigger = None
+                st.rerun()
+        elif st.session_state.search_list_active:
+            if st.sidebar.button("Tüm Sorulara Geri Dön", key="exit_search_button"):
+                st.session_state.search_list_active = False
+                set_question_list(bank.all_indices())
+                st.session_state.index = 0
+                st.session_state.feedback_trigger = None
+                st.rerun()
+        elif not st.session_state.review_mode_active:
+            if st.sidebar.button("Aralıklı Tekrar ile Çalış", key="spaced_button"):
+                # Liste bankanın tamamıdır; sıradaki soruyu her seferinde planlayıcı seçer
+                st.session_state.spaced_repetition_active = True
+                set_question_list(bank.all_indices())
+                st.session_state.index = next_due_index()
+                st.session_state.prev_index = st.session_state.index
+                st.session_state.answer_round = st.session_state.scheduler.clock
+                st.session_state.feedback_trigger = None
+                st.rerun()
             if st.sidebar.button("İlk Denemede Yanlış Yapılanları Kontrol Et", key="review_button"):
-                incorrect_questions_for_review = [
-                    q for q in questions_full_list 
-                    if st.session_state.first_attempt_statuses.get(q["number"]) is False
-                ]
+                incorrect_questions_for_review = bank.indices(
+                    i for i, q in enumerate(bank)
+                    if st.session_state.first_attempt_statuses.get(q.number) is False
+                )
                 if not incorrect_questions_for_review:
                     st.sidebar.success("Tebrikler! İlk denemede yanlış cevapladığınız soru yok.")
                     st.session_state.review_mode_active = False 
                 else:
                     st.session_state.review_mode_active = True
-                    st.session_state.current_question_list = incorrect_questions_for_review
+                    set_question_list(incorrect_questions_for_review)
                     st.session_state.index = 0 
                     st.session_state.feedback_trigger = None 
                     st.rerun()
         else: # review_mode_active True ise
             if st.sidebar.button("Tüm Sorulara Geri Dön", key="exit_review_button"):
                 st.session_state.review_mode_active = False
-                st.session_state.current_question_list = questions_full_list
+                set_question_list(bank.all_indices())
                 st.session_state.index = 0 
                 st.session_state.feedback_trigger = None 
                 st.rerun()
 
         st.sidebar.markdown("---")
-        st.sidebar.header("Cevap Durumları (İlk Deneme)")
-        # Cevaplanmış soruları ve durumlarını göster (ilk denemeye göre, sadece Alıştırma Modunda)
-        for i, q_full in enumerate(questions_full_list): 
-            first_attempt_status = st.session_state.first_attempt_statuses.get(q_full["number"])
-            
-            if first_attempt_status is not None: 
-                status_emoji = "✅" if first_attempt_status is True else "❌"
-                st.sidebar.write(f"{i + 1}. Soru ({q_full['number']}): {status_emoji}")
-            else: 
-                st.sidebar.write(f"{i + 1}. Soru ({q_full['number']}): ⚪") 
+        st.sidebar.header("Soru Ara")
+        search_query = st.sidebar.text_input("Soru metninde veya şıklarda ara:", key="search_query")
+        if search_query.strip():
+            # Sorgu ters indekste çözülür; banka taranmaz
+            with metrics.span("search"):
+                matches = get_search_index(bank, bank.fingerprint).search(search_query)
+            if not matches:
+                st.sidebar.info("Eşleşen soru bulunamadı.")
+            else:
+                st.sidebar.caption(f"{len(matches)} soru bulundu")
+                st.sidebar.selectbox(
+                    "Sonuçlar:",
+                    matches[:SEARCH_RESULT_LIMIT],
+                    format_func=lambda i: f"{bank[i].number}. {bank[i].question[:60]}",
+                    key="search_result_choice",
+                )
+                st.sidebar.button("Soruya Git", key="search_jump_button", on_click=jump_to_search_result, args=(bank,))
+                if st.sidebar.button("Sonuçlarla Çalış", key="search_list_button"):
+                    st.session_state.search_list_active = True
+                    st.session_state.review_mode_active = False
+                    st.session_state.spaced_repetition_active = False
+                    set_question_list(matches)
+                    st.session_state.index = 0
+                    st.session_state.feedback_trigger = None
+                    st.rerun()
+
+        st.sidebar.markdown("---")
+        status_area = st.sidebar.container()
+        status_area.header("Cevap Durumları (İlk Deneme)")
+
+    # Soru paneli bir fragment olarak çalışır; cevap verme ve gezinme yalnızca paneli yeniden çalıştırır
+    render_question_panel(bank, stats_area, status_area)
 
 if __name__ == "__main__":
-    main()
+    # Her tam sayfa çalıştırması ölçülür (süre, öğe sayısı, st.rerun zinciri)
+    with metrics.script_run("app", st.session_state, profile=is_profiled_session()):
+        main()
@@ -0,0 +1,81 @@
+import json
+import os
+
+from loaders import QUESTION_SOURCES, ANSWER_SOURCES, pick_source, figure_source
+
+
+# Katalog dosyası yoksa yalnızca varsayılan kaynaklardan oluşan tek banka sunulur
+DEFAULT_BANK_ID = "varsayilan"
+DEFAULT_BANK_NAME = "İSG Soru Bankası"
+
+
+def source_paths(questions_path, answers_path, figures_path=None):
+    """
+    Bankanın parmak izine giren kaynak dosyalar. Şekiller soru metninden ayrı bir PDF'ten
+    alınıyorsa o da eklenir; eş PDF değişince (veya sonradan eklenince) banka yeniden derlenir.
+    """
+    if figures_path and figures_path != questions_path:
+        return questions_path, answers_path, figures_path
+    return questions_path, answers_path
+
+
+class BankSpec:
+    """
+    Katalogdaki bir bankanın tanımı; banka içeriği yalnızca ilk kullanımda yüklenir.
+    figures_path, soru şekillerinin kırpılacağı PDF'tir (yoksa None; banka şekilsiz sunulur).
+    """
+
+    __slots__ = ("id", "name", "questions_path", "answers_path", "figures_path")
+
+    def __init__(self, bank_id, name, questions_path, answers_path, figures_path=None):
+        self.id = bank_id
+        self.name = name
+        self.questions_path = questions_path
+        self.answers_path = answers_path
+        self.figures_path = figures_path
+
+    @property
+    def sources(self):
+        return source_paths(self.questions_path, self.answers_path, self.figures_path)
+
+
+def default_catalog():
+    questions_path = pick_source(QUESTION_SOURCES)
+    return {
+        DEFAULT_BANK_ID: BankSpec(
+            DEFAULT_BANK_ID, DEFAULT_BANK_NAME, questions_path, pick_source(ANSWER_SOURCES), figure_source(questions_path),
+        ),
+    }
+
+
+def load_catalog(path):
+    """
+    Banka kataloğunu {banka kimliği: BankSpec} olarak, dosyadaki sırasıyla okur.
+    Katalog bir JSON listesidir: [{"id": "a-sinifi", "name": "A Sınıfı", "questions": "...", "answers": "..."}]
+    İsteğe bağlı "figures" alanı şekillerin kırpılacağı PDF'i verir; verilmezse soru dosyası PDF ise
+    kendisi, değilse aynı klasördeki eş PDF (FIGURE_SOURCES) kullanılır.
+    Göreli dosya yolları katalog dosyasının bulunduğu klasöre göre çözülür.
+    Katalog dosyası yoksa varsayılan tek bankalık katalog döner.
+    """
+    if not os.path.exists(path):
+        return default_catalog()
+
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    catalog = {}
+    for entry in entries:
+        bank_id = str(entry["id"])
+        if bank_id in catalog:
+            raise ValueError(f"Katalogda aynı banka kimliği birden fazla kez geçiyor: {bank_id}")
+        questions_path = os.path.join(base_dir, entry["questions"])
+        catalog[bank_id] = BankSpec(
+            bank_id,
+            entry.get("name", bank_id),
+            questions_path,
+            os.path.join(base_dir, entry["answers"]),
+            os.path.join(base_dir, entry["figures"]) if entry.get("figures") else figure_source(questions_path),
+        )
+    if not catalog:
+        raise ValueError(f"Banka kataloğu boş: {path}")
+    return catalog
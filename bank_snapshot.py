@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+
+
+# Derlenmiş soru bankası anlık görüntülerinin tutulduğu klasör
+SNAPSHOT_DIR = ".bank_cache"
+# Anlık görüntü biçimi değişirse eski dosyalar otomatik olarak geçersiz sayılır
+SNAPSHOT_VERSION = 4
+
+# (yol, boyut, değiştirilme zamanı) -> içerik özeti; aynı süreçte dosyayı tekrar okumamak için
+_fingerprint_memo = {}
+
+
+def _file_digest(path):
+    """
+    Dosyanın SHA-256 özetini döndürür. Dosya yoksa None döner.
+    Sonuç, dosyanın boyutu ve değiştirilme zamanı aynı kaldıkça bellekte tutulur.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    digest = _fingerprint_memo.get(memo_key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        _fingerprint_memo[memo_key] = digest
+    return digest
+
+
+def source_fingerprint(*paths):
+    """
+    Kaynak dosyaların içeriğinden tek bir parmak izi üretir.
+    Dosyalardan biri değiştiğinde parmak izi de değişir ve yeniden ayrıştırma gerekir.
+    Dosya eksikse None döner (eksik kaynak için anlık görüntü kullanılmaz).
+    """
+    hasher = hashlib.sha256(f"v{SNAPSHOT_VERSION}".encode())
+    for path in paths:
+        digest = _file_digest(path)
+        if digest is None:
+            return None
+        hasher.update(os.path.basename(path).encode("utf-8"))
+        hasher.update(digest.encode("ascii"))
+    return hasher.hexdigest()
+
+
+def snapshot_path(fingerprint, directory=SNAPSHOT_DIR):
+    return os.path.join(directory, f"bank-{fingerprint[:32]}.json")
+
+
+def load_snapshot(fingerprint, directory=SNAPSHOT_DIR):
+    """
+    Parmak izine ait derlenmiş bankayı okur.
+    Dosya yoksa, bozuksa veya farklı bir sürüme aitse None döner.
+    """
+    if fingerprint is None:
+        return None
+    path = snapshot_path(fingerprint, directory)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("version") != SNAPSHOT_VERSION or data.get("fingerprint") != fingerprint:
+        return None
+    return data
+
+
+def save_snapshot(fingerprint, questions, answers, duplicates=(), directory=SNAPSHOT_DIR):
+    """
+    Ayrıştırılmış soruları, cevap anahtarını ve neredeyse aynı soru kümelerini diske yazar.
+    Yazma işlemi geçici dosya + os.replace ile yapılır, böylece aynı anda başlayan
+    başka bir süreç yarım yazılmış dosya okumaz.
+    """
+    if fingerprint is None:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    path = snapshot_path(fingerprint, directory)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": fingerprint,
+        "questions": questions,
+        "answers": answers,
+        "duplicates": [list(cluster) for cluster in duplicates],
+    }
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,288 @@
+"""
+app.py için eşzamanlı oturum yük testi.
+
+Streamlit'in AppTest aracıyla uygulamayı tarayıcısız çalıştırır ve N öğrenciyi aynı anda
+gerçekçi akışlarla simüle eder: alıştırma modunda cevaplama (doğru cevapta otomatik ilerleme),
+soru atlama, ileri/geri, sınav moduna geçiş, sınavı bitirme ve yanlışları inceleme.
+Her yeniden çalıştırmanın süresi ölçülür; işlem türüne göre gecikme yüzdelikleri,
+oturum başına bellek ve toplam verim raporlanır.
+
+AppTest örnekleri aynı süreçte paralel iş parçacıklarında çalıştırılamadığı için her süreç
+kendi öğrencilerini sırayla, adım adım dönüşümlü çalıştırır (tüm oturumlar bellekte birlikte
+yaşar, tıpkı tek bir sunucu sürecindeki gibi). --processes ile öğrenciler birden çok sürece
+dağıtılarak gerçek eşzamanlılık elde edilir.
+
+Kullanım:
+    python benchmarks/load_test.py --students 20 --answers 30 --exams 1 --processes 4
+"""
+import argparse
+import atexit
+import json
+import os
+import random
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class Student:
+    """
+    Tek bir öğrencinin oturumu; her etkileşim bir AppTest yeniden çalıştırmasıdır.
+    Akış metotları her etkileşimden sonra yield eder, böylece öğrenciler dönüşümlü çalıştırılabilir.
+    """
+
+    def __init__(self, student_id, answers, rng, timeout):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.at.query_params["oturum"] = f"yuk-testi-{student_id}"
+        self.answers = answers
+        self.rng = rng
+        self.timings = defaultdict(list)
+        self.errors = []
+
+    def _run(self, action, element=None):
+        start = time.perf_counter()
+        if element is None:
+            self.at.run()
+        else:
+            element.run()
+        self.timings[action].append(time.perf_counter() - start)
+        if self.at.exception:
+            self.errors.append(f"{action}: {self.at.exception[0].value}")
+
+    def _has(self, elements, key):
+        return any(e.key == key for e in elements)
+
+    def _current_radio(self):
+        key = f"q{self.at.session_state['index']}"
+        return self.at.radio(key=key) if self._has(self.at.radio, key) else None
+
+    def _answer(self, action, correct_ratio):
+        radio = self._current_radio()
+        if radio is None or not radio.options or radio.disabled:
+            # Şıkkı olmayan sorular atlanır
+            if self._has(self.at.button, "next_button") and not self.at.button(key="next_button").disabled:
+                self._run("ileri", self.at.button(key="next_button").click())
+                yield
+            return
+        bank_idx = self.at.session_state["current_indices"][self.at.session_state["index"]]
+        number = self.question_numbers[bank_idx]
+        correct = self.answers.get(number)
+        options = list(radio.options)
+        choice = None
+        if correct and self.rng.random() < correct_ratio:
+            choice = next((o for o in options if o[:1].lower() == correct), None)
+        if choice is None:
+            choice = self.rng.choice(options)
+        self._run(action, radio.set_value(options.index(choice))) # Radyonun değeri şıkkın konumudur
+        yield
+
+    def practice(self, answer_count):
+        for _ in range(answer_count):
+            yield from self._answer("alistirma_cevap", correct_ratio=0.7)
+            roll = self.rng.random()
+            if roll < 0.1 and self._has(self.at.number_input, "jump_input"):
+                total = len(self.at.session_state["current_indices"])
+                self.at.number_input(key="jump_input").set_value(self.rng.randint(1, total))
+                self._run("atla", self.at.button(key="jump_button").click())
+                yield
+            elif roll < 0.15 and self._has(self.at.button, "prev_button") and not self.at.button(key="prev_button").disabled:
+                self._run("geri", self.at.button(key="prev_button").click())
+                yield
+
+    def exam(self):
+        self._run("mod_sinav", self.at.sidebar.radio(key="mode_selection").set_value("Sınav Modu"))
+        yield
+        total = len(self.at.session_state["current_indices"])
+        for _ in range(total):
+            yield from self._answer("sinav_cevap", correct_ratio=0.6)
+        if self._has(self.at.button, "submit_exam_button"):
+            self._run("sinav_bitir", self.at.button(key="submit_exam_button").click())
+            yield
+        if self._has(self.at.sidebar.button, "review_exam_incorrect_button"):
+            self._run("yanlis_incele", self.at.sidebar.button(key="review_exam_incorrect_button").click())
+            yield
+            self._run("sonuca_don", self.at.button(key="back_to_exam_results_review").click())
+            yield
+        self._run("mod_alistirma", self.at.sidebar.radio(key="mode_selection").set_value("Alıştırma Modu"))
+        yield
+
+    def session_bytes(self):
+        """Oturumun kalıcı depoya yazılan durumunun JSON boyutu (oturum başına durum yükü)."""
+        from progress_store import export_progress
+
+        return len(json.dumps(export_progress(self.at.session_state, None), ensure_ascii=False))
+
+    def simulate(self, answer_count, exam_count, question_numbers):
+        self.question_numbers = question_numbers
+        self._run("ilk_yukleme")
+        yield
+        yield from self.practice(answer_count)
+        for _ in range(exam_count):
+            yield from self.exam()
+
+
+def run_group(student_ids, args):
+    """
+    Bir süreçteki öğrencileri dönüşümlü çalıştırır ve ham ölçümleri döndürür.
+    Her öğrenci bir adım atar, sonra sıradakine geçilir; böylece tüm oturumlar aynı anda açıktır.
+    """
+    os.chdir(ROOT) # Uygulama kaynak dosyalarını göreli yollarla arar
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    import app
+    from loaders import load_answers
+
+    # Öğrenciler katalogdaki ilk (varsayılan) bankada çalışır
+    spec = next(iter(app.get_bank_catalog().values()))
+    answers = load_answers(spec.answers_path)
+
+    # Isınma: banka ve önbellekler ölçüm öncesi yüklenir
+    warmup = Student("isinma", answers, random.Random(args.seed), args.timeout)
+    warmup._run("isinma")
+    bank = app.get_question_bank(spec.questions_path, spec.answers_path, spec.figures_path,
+                                 app.source_fingerprint(*spec.sources))
+    question_numbers = [q.number for q in bank]
+
+    # tracemalloc her ayırmayı izlediği için gecikmeleri şişirir; yalnızca istenirse açılır
+    if args.trace_memory:
+        tracemalloc.start()
+        base_memory, _ = tracemalloc.get_traced_memory()
+    else:
+        base_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    students = [Student(i, answers, random.Random(args.seed + i), args.timeout) for i in student_ids]
+    flows = [s.simulate(args.answers, args.exams, question_numbers) for s in students]
+
+    start = time.perf_counter()
+    while flows:
+        for flow in list(flows):
+            try:
+                next(flow)
+            except StopIteration:
+                flows.remove(flow)
+    elapsed = time.perf_counter() - start
+    if args.trace_memory:
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    else:
+        # Linux'ta ru_maxrss KB cinsindendir; tepe RSS artışı oturumlara bölünür
+        current_memory = peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    timings = defaultdict(list)
+    for s in students:
+        for action, values in s.timings.items():
+            timings[action].extend(values)
+    return {
+        "timings": dict(timings),
+        "errors": [e for s in students for e in s.errors],
+        "elapsed": elapsed,
+        "memory_per_session": (current_memory - base_memory) / max(1, len(students)),
+        "peak_memory": peak_memory,
+        "session_bytes": [s.session_bytes() for s in students],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="app.py için eşzamanlı oturum yük testi")
+    parser.add_argument("--students", type=int, default=10, help="Eşzamanlı öğrenci sayısı")
+    parser.add_argument("--answers", type=int, default=30, help="Öğrenci başına alıştırma cevabı")
+    parser.add_argument("--exams", type=int, default=1, help="Öğrenci başına sınav sayısı")
+    parser.add_argument("--processes", type=int, default=1, help="Öğrencilerin dağıtılacağı süreç sayısı")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Oturum belleğini tracemalloc ile ölç (daha kesin ama gecikmeleri artırır)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Tek bir yeniden çalıştırma için süre sınırı (sn)")
+    parser.add_argument("--json", dest="json_path", help="Sonuçları ayrıca bu JSON dosyasına yaz")
+    args = parser.parse_args(argv)
+
+    # Yük testi gerçek ilerleme ve istatistik veritabanlarını kirletmesin. Geçici klasör çıkışta silinir;
+    # depolardan önce kaydedildiği için atexit onların son yazmalarından sonra çalıştırır.
+    workdir = tempfile.mkdtemp(prefix="isg-yuk-")
+    atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+    os.environ.setdefault("ISG_PROGRESS_DB", os.path.join(workdir, "ilerleme.sqlite3"))
+    os.environ.setdefault("ISG_ANALYTICS_DB", os.path.join(workdir, "analitik.sqlite3"))
+
+    processes = max(1, min(args.processes, args.students))
+    groups = [list(range(i, args.students, processes)) for i in range(processes)]
+    wall_start = time.perf_counter()
+    if processes == 1:
+        results = [run_group(groups[0], args)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(run_group, groups, [args] * processes))
+    wall = max(r["elapsed"] for r in results)
+    total_wall = time.perf_counter() - wall_start
+
+    merged = defaultdict(list)
+    for r in results:
+        for action, values in r["timings"].items():
+            merged[action].extend(values)
+    all_runs = [v for values in merged.values() for v in values]
+    errors = [e for r in results for e in r["errors"]]
+    session_bytes = [b for r in results for b in r["session_bytes"]]
+
+    report = {
+        "students": args.students,
+        "reruns": len(all_runs),
+        "processes": processes,
+        "wall_seconds": wall,
+        "total_seconds_with_startup": total_wall,
+        "reruns_per_second": len(all_runs) / wall if wall else 0.0,
+        "memory_per_session_kb": statistics.mean(r["memory_per_session"] for r in results) / 1024,
+        "memory_source": "tracemalloc" if args.trace_memory else "rss",
+        "peak_memory_mb": max(r["peak_memory"] for r in results) / 1024 / 1024,
+        "session_state_bytes_mean": statistics.mean(session_bytes) if session_bytes else 0,
+        "errors": errors[:20],
+        "actions": {
+            action: {
+                "count": len(values),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p90_ms": percentile(values, 90) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": max(values) * 1000,
+            }
+            for action, values in sorted(merged.items())
+        },
+    }
+
+    print(f"{args.students} öğrenci / {processes} süreç, {report['reruns']} yeniden çalıştırma, {wall:.2f} sn "
+          f"({report['reruns_per_second']:.1f} çalıştırma/sn)")
+    print(f"Oturum başına bellek: {report['memory_per_session_kb']:.1f} KB | "
+          f"Tepe bellek: {report['peak_memory_mb']:.1f} MB | "
+          f"Oturum durumu: {report['session_state_bytes_mean']:.0f} bayt")
+    print(f"{'işlem':<16}{'adet':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for action, stats in report["actions"].items():
+        print(f"{action:<16}{stats['count']:>7}{stats['p50_ms']:>10.1f}{stats['p90_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+    if errors:
+        print(f"{len(errors)} hata; ilkleri:", *errors[:5], sep="\n  ")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+app.py için açılış süresi ölçümü: soğuk ve sıcak önbellekle içe aktarma ve ilk çizim süreleri.
+
+Her ölçüm yeni bir Python sürecinde yapılır (konteynerin ayağa kalkması gibi):
+    import    : "import app" süresi (Streamlit + uygulama modülleri)
+    render    : AppTest ile ilk sayfa çalıştırmasının süresi (banka yükleme dahil)
+    total     : sürecin başlatılmasından ilk çizimin bitmesine kadar geçen süre
+Soğuk ölçümde her süreç boş bir geçici klasörde çalışır (derlenmiş banka yok, kaynaklar
+ayrıştırılır); sıcak ölçümde anlık görüntü önceden yazılmıştır. İlk çizimden sonra yüklenmiş
+ağır modüller (fitz, docx, numpy) de raporlanır; sıcak açılışta hiçbiri yüklenmemelidir.
+
+Kullanım:
+    python benchmarks/startup.py --runs 5
+    python benchmarks/startup.py --questions sorular_ve_siklar.pdf --answers dogru_cevaplar.pdf --json acilis.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+HEAVY_MODULES = ("fitz", "docx", "numpy")
+
+# Ölçülen süreçte çalışan kod; sonuçları son satırda JSON olarak yazar
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import app
+import_seconds = time.perf_counter() - start
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app_path!r}, default_timeout={timeout!r})
+render_start = time.perf_counter()
+at.run()
+render_seconds = time.perf_counter() - render_start
+print(json.dumps({{
+    "import": import_seconds,
+    "render": render_seconds,
+    "errors": [str(e.value) for e in at.exception],
+    "heavy_modules": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def run_once(workdir, timeout):
+    """Ölçümü yeni bir süreçte, verilen çalışma klasöründe yapar."""
+    env = dict(os.environ)
+    env["ISG_BANK_CATALOG"] = os.path.join(workdir, "bankalar.json")
+    # İlerleme ve istatistik veritabanları gerçek dosyaları kirletmesin
+    env["ISG_PROGRESS_DB"] = os.path.join(workdir, "ilerleme.sqlite3")
+    env["ISG_ANALYTICS_DB"] = os.path.join(workdir, "analitik.sqlite3")
+    script = CHILD_SCRIPT.format(root=ROOT, app_path=APP_PATH, timeout=timeout, heavy=HEAVY_MODULES)
+
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=workdir, env=env, capture_output=True, text=True,
+    )
+    total = time.perf_counter() - start
+    if completed.returncode != 0 or not completed.stdout.strip():
+        raise RuntimeError(f"Ölçüm süreci başarısız oldu:\n{completed.stderr[-2000:]}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["total"] = total
+    return result
+
+
+@contextlib.contextmanager
+def make_workdir(questions_path, answers_path):
+    """
+    Yalnızca tek bankalık bir katalog içeren boş bir çalışma klasörü (önbellek yok).
+    Klasör (anlık görüntü ve veritabanlarıyla birlikte) ölçüm bitince silinir.
+    """
+    with tempfile.TemporaryDirectory(prefix="isg-acilis-") as workdir:
+        with open(os.path.join(workdir, "bankalar.json"), "w", encoding="utf-8") as f:
+            json.dump([{
+                "id": "varsayilan",
+                "name": "Açılış ölçümü",
+                "questions": os.path.abspath(questions_path),
+                "answers": os.path.abspath(answers_path),
+            }], f, ensure_ascii=False)
+        yield workdir
+
+
+def summarize(results):
+    summary = {
+        key: {
+            "median_ms": statistics.median(r[key] for r in results) * 1000,
+            "max_ms": max(r[key] for r in results) * 1000,
+        }
+        for key in ("import", "render", "total")
+    }
+    summary["heavy_modules"] = sorted({m for r in results for m in r["heavy_modules"]})
+    summary["errors"] = [e for r in results for e in r["errors"]][:5]
+    return summary
+
+
+def main(argv=None):
+    sys.path.insert(0, ROOT)
+    from loaders import QUESTION_SOURCES, ANSWER_SOURCES, pick_source
+
+    # Varsayılan kaynaklar uygulama klasöründen seçilir; verilen yollar çalışılan klasöre göredir
+    parser = argparse.ArgumentParser(description="app.py açılış süresini soğuk ve sıcak önbellekle ölçer")
+    parser.add_argument("--questions", default=pick_source([os.path.join(ROOT, p) for p in QUESTION_SOURCES]),
+                        help="Soru dosyası")
+    parser.add_argument("--answers", default=pick_source([os.path.join(ROOT, p) for p in ANSWER_SOURCES]),
+                        help="Cevap anahtarı")
+    parser.add_argument("--runs", type=int, default=3, help="Her senaryo için ölçüm sayısı")
+    parser.add_argument("--timeout", type=float, default=300.0, help="İlk çizim için süre sınırı (sn)")
+    parser.add_argument("--json", dest="json_path", help="Sonuçları ayrıca bu JSON dosyasına yaz")
+    args = parser.parse_args(argv)
+
+    # Soğuk: her ölçüm yeni ve boş bir klasörde; sıcak: ilk soğuk ölçümün yazdığı anlık görüntüyle
+    cold = []
+    for _ in range(args.runs):
+        with make_workdir(args.questions, args.answers) as workdir:
+            cold.append(run_once(workdir, args.timeout))
+    with make_workdir(args.questions, args.answers) as warm_dir:
+        run_once(warm_dir, args.timeout)
+        warm = [run_once(warm_dir, args.timeout) for _ in range(args.runs)]
+
+    report = {
+        "questions": args.questions,
+        "answers": args.answers,
+        "runs": args.runs,
+        "cold": summarize(cold),
+        "warm": summarize(warm),
+    }
+
+    print(f"{args.questions} + {args.answers}, senaryo başına {args.runs} ölçüm (medyan / en kötü, ms)")
+    print(f"{'önbellek':<10}{'import':>18}{'ilk çizim':>18}{'toplam':>18}  ağır modüller")
+    for name in ("cold", "warm"):
+        stats = report[name]
+        cells = "".join(
+            f"{stats[key]['median_ms']:>10.0f} / {stats[key]['max_ms']:<5.0f}" for key in ("import", "render", "total")
+        )
+        label = "soğuk" if name == "cold" else "sıcak"
+        print(f"{label:<10}{cells}  {', '.join(stats['heavy_modules']) or '-'}")
+        if stats["errors"]:
+            print("  hatalar:", *stats["errors"], sep="\n    ")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if report["cold"]["errors"] or report["warm"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import itertools
+import random
+import threading
+from array import array
+
+
+class ExamBlueprint:
+    """
+    Önceden üretilmiş bir sınav: bankadaki soru indekslerinin kompakt dizisi.
+    Aynı (seed, size, strata_count) ile aynı bankadan her zaman aynı sınav yeniden üretilir.
+    """
+
+    __slots__ = ("id", "seed", "size", "strata_count", "indices")
+
+    def __init__(self, blueprint_id, seed, size, strata_count, indices):
+        self.id = blueprint_id
+        self.seed = seed
+        self.size = size
+        self.strata_count = strata_count
+        self.indices = array("I", indices)
+
+
+# Kimlikteki katman türü: K = numara aralığı (kimlikten yeniden üretilebilir),
+# Z = zorluk (o anki istatistiklere bağlıdır, yalnızca havuzda yaşarken geçerlidir)
+NUMBER_STRATA_TAG = "K"
+DIFFICULTY_STRATA_TAG = "Z"
+# Rastgele seçilen başlangıç tohumunun üst sınırı (sınav kodları kısa kalsın diye)
+SEED_RANGE = 1_000_000
+
+
+def pick_base_seed(configured=None):
+    """
+    Havuzun başlangıç tohumu: verilmişse o (ör. bütün sunucularda aynı sınavlar için), yoksa rastgele.
+    Sabit bir tohumla her yeniden başlatmada tüm süreçler aynı sınavları aynı sırayla dağıtırdı.
+    """
+    if configured is not None:
+        return configured
+    return random.SystemRandom().randrange(SEED_RANGE)
+
+
+def blueprint_id(seed, size, strata_count, tag=NUMBER_STRATA_TAG):
+    return f"S{size}-{tag}{strata_count}-{seed}"
+
+
+def _number_key(question):
+    number = question.number
+    return (0, int(number)) if number.isdigit() else (1, number)
+
+
+def stratify_by_number_range(bank, strata_count):
+    """
+    Soruları numara sırasına göre strata_count adet ardışık aralığa böler.
+    Bankalar genellikle konu konu numaralandığı için aralıklar kabaca konulara karşılık gelir.
+    """
+    ordered = sorted(range(len(bank)), key=lambda i: _number_key(bank[i]))
+    strata_count = max(1, min(strata_count, len(ordered)))
+    bounds = [round(k * len(ordered) / strata_count) for k in range(strata_count + 1)]
+    return [ordered[bounds[k]:bounds[k + 1]] for k in range(strata_count)]
+
+
+def stratify_by_difficulty(bank, accuracy_by_number, strata_count):
+    """
+    Soruları ilk denemede doğru oranına göre kolaydan zora sıralayıp strata_count katmana böler.
+    Henüz yeterli cevabı olmayan sorular orta zorlukta (0.5) sayılır.
+    """
+    ordered = sorted(
+        range(len(bank)),
+        key=lambda i: (-accuracy_by_number.get(bank[i].number, 0.5), _number_key(bank[i])),
+    )
+    strata_count = max(1, min(strata_count, len(ordered)))
+    bounds = [round(k * len(ordered) / strata_count) for k in range(strata_count + 1)]
+    return [ordered[bounds[k]:bounds[k + 1]] for k in range(strata_count)]
+
+
+def _allocate(strata, size):
+    """Sınav sorularını katmanlara büyüklükleriyle orantılı dağıtır (en büyük kalan yöntemi)."""
+    total = sum(len(s) for s in strata)
+    size = min(size, total)
+    quotas = [len(s) * size / total for s in strata]
+    counts = [int(q) for q in quotas]
+    remaining = size - sum(counts)
+    by_remainder = sorted(range(len(strata)), key=lambda k: quotas[k] - counts[k], reverse=True)
+    for k in by_remainder[:remaining]:
+        counts[k] += 1
+    return counts
+
+
+def generate_blueprint(bank, size, seed, strata_count=1, strata=None, tag=NUMBER_STRATA_TAG):
+    """
+    Tohumlu, katmanlı örnekleme ile tek bir sınav üretir.
+    strata verilmezse numara aralıklarına göre katmanlar oluşturulur; konu bilgisi olan
+    bankalar için katmanlar (indeks listeleri) dışarıdan verilebilir.
+    """
+    if strata is None:
+        strata = stratify_by_number_range(bank, strata_count)
+    rng = random.Random(seed)
+    chosen = []
+    for stratum, count in zip(strata, _allocate(strata, size)):
+        chosen.extend(rng.sample(stratum, count))
+    rng.shuffle(chosen) # Katmanlar sınav içinde karışık sırada gelir
+    return ExamBlueprint(blueprint_id(seed, size, len(strata), tag), seed, size, len(strata), chosen)
+
+
+def regenerate_blueprint(bank, blueprint_id_text):
+    """
+    Kimlikten (S{size}-K{strata_count}-{seed}) aynı sınavı yeniden üretir.
+    Bir öğrencinin sınavını sonradan birebir incelemek için kullanılır; kimlik geçersizse None döner.
+    """
+    try:
+        size_part, strata_part, seed_part = blueprint_id_text.split("-", 2)
+        size = int(size_part[1:])
+        strata_count = int(strata_part[1:])
+        seed = int(seed_part)
+    except ValueError:
+        return None
+    if not (size_part.startswith("S") and strata_part.startswith(NUMBER_STRATA_TAG)) or size <= 0 or strata_count <= 0:
+        return None
+    return generate_blueprint(bank, size, seed, strata_count)
+
+
+def generate_blueprints(bank, count, size, base_seed=0, strata_count=1, strata=None, tag=NUMBER_STRATA_TAG):
+    """
+    count adet sınavı toplu üretir; katmanlar bir kez hesaplanıp hepsinde kullanılır.
+    Dışarıdan katman verilirse (ör. zorluğa göre) tag ile kimliklerde ayırt edilir.
+    """
+    if strata is None:
+        strata = stratify_by_number_range(bank, strata_count)
+    return [generate_blueprint(bank, size, base_seed + n, strata=strata, tag=tag) for n in range(count)]
+
+
+class BlueprintPool:
+    """
+    Önceden üretilmiş sınavların süreç genelindeki havuzu.
+    Yeni sınav başlatmak yalnızca sıradaki kalıbı almaktır (sabit zamanlı); oturumlar
+    kalıbın indeks dizisini kopyalamadan paylaşır ve kimliğini saklar.
+    """
+
+    def __init__(self, blueprints):
+        self._by_id = {b.id: b for b in blueprints}
+        self._cycle = itertools.cycle(blueprints)
+        self._lock = threading.Lock()
+
+    def next(self):
+        with self._lock:
+            return next(self._cycle)
+
+    def get_or_regenerate(self, bank, blueprint_id):
+        """
+        Havuzdaki kalıbı döndürür; havuzda yoksa kimlikten yeniden üretir.
+        Yeniden üretilen kalıp havuza eklenmez, böylece rastgele kodlar havuzu büyütemez.
+        """
+        blueprint = self._by_id.get(blueprint_id)
+        if blueprint is None:
+            blueprint = regenerate_blueprint(bank, blueprint_id)
+        return blueprint
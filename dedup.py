@@ -0,0 +1,168 @@
+"""
+Soru bankasında neredeyse aynı soruların (küçük ifade farklarıyla tekrarlananların) tespiti.
+
+Sorunun metni ve şıkları ayrı ayrı kelime üçlülerine (shingle) ayrılır ve MinHash imzalarıyla
+özetlenir; iki soru ancak hem metinleri hem şıkları benzerse kopya sayılır (aynı şıkları paylaşan
+"A sınıfı yangın hangisidir?" ve "B sınıfı yangın hangisidir?" gibi sorular ayrı kalır).
+İmzalar LSH bantlarına bölünür; yalnızca en az bir bantta aynı kovaya düşen sorular karşılaştırılır.
+Böylece n² çift yerine yaklaşık doğrusal sürede kümeler bulunur.
+
+Kullanım:
+    python dedup.py sorular.docx --threshold 0.8
+"""
+import argparse
+import re
+import sys
+import zlib
+
+import numpy as np
+
+from search_index import tokenize
+
+
+NUM_PERM = 64 # Metin ve şıklar için ayrı ayrı imza uzunluğu (hash fonksiyonu sayısı)
+BANDS = 32 # Birleşik imzadaki LSH bant sayısı; bant başına 2 * NUM_PERM // BANDS = 4 satır
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8 # Aday çiftin kopya sayılması için gereken tahmini Jaccard benzerliği
+
+# (a*x + b) mod p, 2^32'nin altındaki en büyük asala göre alınır; a, b ve x p'den küçük olduğundan
+# a*x + b < p^2 < 2^64 ve uint64 taşmaz. Modül çarpımdan küçük olmalı ki hash gerçekten karışsın:
+# aksi halde her "permütasyon" x'te artan olur ve tüm satırlar aynı en küçük shingle'ı seçer.
+_PRIME = np.uint64(4294967291)
+# Şık etiketleri ("a.", "B)") benzerliğe katılmaz; şık sırası değişen kopyalar da yakalanır
+OPTION_LABEL_PATTERN = re.compile(r"^\s*[a-eA-E]\s*[.)]\s*")
+
+
+def shingles(text):
+    """Metindeki kelime üçlülerinin 32 bitlik özetleri (tekrarsız)."""
+    tokens = tokenize(text)
+    if len(tokens) < SHINGLE_SIZE:
+        grams = [" ".join(tokens)]
+    else:
+        grams = [" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)]
+    return np.unique(np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64))
+
+
+def option_text(question):
+    """Şıkların etiketleri atılmış ve sıralanmış hali; şık sırası değişen kopyalar da yakalanır."""
+    return " ".join(sorted(OPTION_LABEL_PATTERN.sub("", opt) for opt in question["options"]))
+
+
+class MinHasher:
+    """Sabit tohumlu hash ailesi; aynı tohumla her süreçte aynı imzalar üretilir."""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)[:, None]
+        self.b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, hashes):
+        hashes = hashes % _PRIME
+        return ((self.a * hashes[None, :] + self.b) % _PRIME).min(axis=1)
+
+    def signatures(self, questions):
+        """
+        Tüm soruların birleşik imzalarını (soru sayısı x 2 * NUM_PERM) bir matris olarak döndürür:
+        ilk yarı soru metninin, ikinci yarı şıkların imzasıdır.
+        """
+        num_perm = len(self.a)
+        sigs = np.empty((len(questions), 2 * num_perm), dtype=np.uint64)
+        for i, question in enumerate(questions):
+            sigs[i, :num_perm] = self.signature(shingles(question["question"]))
+            sigs[i, num_perm:] = self.signature(shingles(option_text(question)))
+        return sigs
+
+
+def _candidate_pairs(sigs, bands):
+    """
+    Herhangi bir bantta aynı kovaya düşen soru çiftleri, (ilk, ikinci) indeks dizileri olarak.
+    Kovadaki her soru yalnızca kovanın ilk sorusuyla eşleştirilir; kümeler birleşim-bul ile
+    geçişli olarak tamamlandığı için çok kalabalık kovalar bile kare sayıda çift üretmez.
+    """
+    rows = sigs.shape[1] // bands
+    pairs = set()
+    for band in range(bands):
+        first_in_bucket = {}
+        block = np.ascontiguousarray(sigs[:, band * rows:(band + 1) * rows])
+        for i in range(len(sigs)):
+            first = first_in_bucket.setdefault(block[i].tobytes(), i)
+            if first != i:
+                pairs.add((first, i))
+    if not pairs:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    first, second = np.array(sorted(pairs), dtype=np.intp).T
+    return first, second
+
+
+def find_duplicate_clusters(questions, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=BANDS):
+    """
+    Neredeyse aynı soruların kümelerini döndürür: her küme en az iki soru indeksinden
+    oluşan artan sıralı bir listedir; kümeler ilk elemanlarına göre sıralıdır.
+    LSH adayları metin ve şık imzalarının ikisiyle de doğrulanır, birleşim-bul ile kümelenir.
+    """
+    if len(questions) < 2:
+        return []
+    sigs = MinHasher(num_perm).signatures(questions)
+
+    parent = list(range(len(questions)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Adayların tamamı tek seferde doğrulanır: metin ve şık imzalarının ikisi de eşiği geçmeli
+    first, second = _candidate_pairs(sigs, bands)
+    same = sigs[first] == sigs[second]
+    text_similarity = np.count_nonzero(same[:, :num_perm], axis=1) / num_perm
+    option_similarity = np.count_nonzero(same[:, num_perm:], axis=1) / num_perm
+    verified = (text_similarity >= threshold) & (option_similarity >= threshold)
+
+    for i, j in zip(first[verified].tolist(), second[verified].tolist()):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters = {}
+    for i in range(len(questions)):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted((members for members in clusters.values() if len(members) > 1), key=lambda c: c[0])
+
+
+def collapse_clusters(questions, clusters):
+    """Her kümeden yalnızca ilk soruyu bırakır; diğer soruları çıkarılmış yeni bir liste döndürür."""
+    dropped = {i for cluster in clusters for i in cluster[1:]}
+    return [q for i, q in enumerate(questions) if i not in dropped]
+
+
+def format_report(questions, clusters):
+    """Kopya kümelerinin okunabilir metin raporu."""
+    if not clusters:
+        return "Neredeyse aynı soru bulunamadı."
+    duplicate_count = sum(len(c) - 1 for c in clusters)
+    lines = [f"{len(clusters)} kümede {duplicate_count} fazladan soru bulundu."]
+    for n, cluster in enumerate(clusters, 1):
+        lines.append(f"Küme {n} ({len(cluster)} soru):")
+        for i in cluster:
+            lines.append(f"  {questions[i]['number']}. {questions[i]['question'][:80]}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from loaders import load_questions
+
+    parser = argparse.ArgumentParser(description="Soru bankasındaki neredeyse aynı soruları raporlar")
+    parser.add_argument("questions", help="Soru dosyası (DOCX, TXT veya PDF)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Benzerlik eşiği (0-1)")
+    args = parser.parse_args(argv)
+
+    questions = load_questions(args.questions)
+    clusters = find_duplicate_clusters(questions, args.threshold)
+    print(format_report(questions, clusters))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
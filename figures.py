@@ -0,0 +1,119 @@
+import hashlib
+import os
+import threading
+
+from bank_snapshot import source_fingerprint
+
+
+# Şekillerin kaynak PDF'ten kırpılıp saklandığı klasör ve varsayılan boyut sınırı
+FIGURE_CACHE_DIR = ".figure_cache"
+FIGURE_CACHE_MAX_BYTES = 200 * 1024 * 1024
+FIGURE_DPI = 150
+# Sınır aşıldığında toplam boyut bu orana inene kadar dosya silinir (her kayıtta tarama yapılmasın diye)
+EVICT_TO_RATIO = 0.9
+
+
+def render_region(pdf_path, region, dpi=FIGURE_DPI):
+    """PDF sayfasındaki bölgeyi verilen çözünürlükte PNG olarak çizer."""
+    import fitz # PyMuPDF yalnızca önbellekte olmayan bir şekil çizilirken gerekir
+
+    page_number, *bbox = region
+    with fitz.open(pdf_path) as doc:
+        return doc[page_number].get_pixmap(dpi=dpi, clip=fitz.Rect(bbox)).tobytes("png")
+
+
+class FigureCache:
+    """
+    Soru şekillerinin (PDF'ten kırpılmış PNG'ler) disk önbelleği.
+    Dosya adı kaynak PDF'in içeriğinden, sayfa/bölgeden ve çözünürlükten türetilir (içerik adresli);
+    kaynak değişince adres de değiştiği için önbellek hiçbir zaman bayat görüntü vermez.
+    İsabet yalnızca bir dosya okumasıdır: PDF açılmaz, görüntü çizilmez.
+    Toplam boyut max_bytes'ı aşınca en uzun süre kullanılmayan dosyalardan başlanarak silinir.
+    Aynı klasörü birden fazla süreç paylaşabilir; yazma geçici dosya + os.replace ile yapılır.
+    """
+
+    def __init__(self, directory=FIGURE_CACHE_DIR, max_bytes=FIGURE_CACHE_MAX_BYTES, dpi=FIGURE_DPI):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.dpi = dpi
+        self._lock = threading.Lock()
+        self._total_bytes = None # İlk yazmada klasör taranarak hesaplanır
+
+    def path_for(self, pdf_path, region):
+        """Şeklin önbellekteki dosya yolu; kaynak PDF yoksa FileNotFoundError."""
+        fingerprint = source_fingerprint(pdf_path)
+        if fingerprint is None:
+            raise FileNotFoundError(pdf_path)
+        page_number, *bbox = region
+        key = hashlib.sha256(
+            f"{fingerprint}:{page_number}:{','.join(f'{v:.1f}' for v in bbox)}:{self.dpi}".encode("ascii")
+        ).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.png")
+
+    def get(self, pdf_path, region):
+        """Şeklin PNG baytları; önbellekte yoksa bir kez çizilip kaydedilir."""
+        path = self.path_for(pdf_path, region)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = None
+        if data is not None:
+            try:
+                os.utime(path) # Son kullanım zamanı; silme sırası buna göre belirlenir
+            except OSError:
+                pass
+            return data
+
+        data = render_region(pdf_path, region, self.dpi)
+        self._store(path, data)
+        return data
+
+    def _store(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, _, size in self._entries())
+            else:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """Önbellekteki (son kullanım, yol, boyut) üçlüleri."""
+        entries = []
+        try:
+            shards = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".png"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue # Başka bir süreç bu arada silmiş olabilir
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def _evict(self):
+        """En uzun süre kullanılmayan dosyaları toplam boyut sınırın altına inene kadar siler."""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * EVICT_TO_RATIO
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
@@ -0,0 +1,195 @@
+"""
+Toplu sınav puanlama: yüzlerce cevap kâğıdını cevap anahtarına göre tek seferde puanlar.
+
+Cevaplar (öğrenci x soru) boyutunda bir uint8 matrise, anahtar bir vektöre kodlanır;
+puanlama ve soru istatistikleri hücre hücre sözlük araması yerine dizi karşılaştırmalarıyla yapılır.
+Anahtarı olmayan sorular, uygulamadaki sınav puanlamasında olduğu gibi doğru sayılamaz.
+
+Girdi biçimleri:
+    CSV  : ilk sütun öğrenci kimliği, diğer sütun başlıkları soru numaraları, hücreler şık harfi (boş = cevapsız)
+    JSONL: her satır {"student": "...", "answers": {"501": "a", "502": "c", ...}}
+
+Kullanım:
+    python grading.py cevap_kagitlari.csv --students-out puanlar.csv --questions-out soru_istatistikleri.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from loaders import ANSWER_SOURCES, pick_source, load_answers
+
+
+LETTERS = "abcde"
+BLANK = 0 # Cevapsız
+INVALID = 255 # Okunamayan/çoklu işaret: cevaplanmış sayılır, hiçbir anahtarla eşleşmez
+
+
+def encode_letter(value):
+    """Şık harfini matris koduna çevirir: boş -> 0, 'a'..'e' -> 1..5, diğerleri -> INVALID."""
+    letter = (value or "").strip().lower().replace("\ufeff", "")
+    if not letter:
+        return BLANK
+    position = LETTERS.find(letter)
+    return position + 1 if len(letter) == 1 and position >= 0 else INVALID
+
+
+def read_submissions(path):
+    """
+    Cevap kâğıtlarını okur; (öğrenci kimlikleri, soru numaraları, cevap sözlükleri) döndürür.
+    Soru numaraları CSV'de sütun sırasıyla, JSONL'de ilk görülme sırasıyla listelenir.
+    """
+    students, submissions = [], []
+    if os.path.splitext(path)[1].lower() == ".jsonl":
+        question_numbers = {}
+        with open(path, "r", encoding="utf-8-sig") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                answers = {str(k): v for k, v in record.get("answers", {}).items()}
+                students.append(str(record.get("student", len(students) + 1)))
+                submissions.append(answers)
+                question_numbers.update(dict.fromkeys(answers))
+        return students, list(question_numbers), submissions
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return [], [], []
+        question_numbers = [h.strip() for h in header[1:]]
+        for row in reader:
+            if not row:
+                continue
+            students.append(row[0].strip())
+            submissions.append(dict(zip(question_numbers, row[1:])))
+    return students, question_numbers, submissions
+
+
+def build_matrix(question_numbers, submissions):
+    """Cevapları (öğrenci x soru) uint8 matrisine kodlar."""
+    matrix = np.zeros((len(submissions), len(question_numbers)), dtype=np.uint8)
+    for row, answers in zip(matrix, submissions):
+        row[:] = [encode_letter(answers.get(number)) for number in question_numbers]
+    return matrix
+
+
+def build_key(question_numbers, answers):
+    """Anahtarı soru sırasına göre vektöre kodlar; anahtarı olmayan soru 0 olur."""
+    key = np.array([encode_letter(answers.get(number)) for number in question_numbers], dtype=np.uint8)
+    key[key == INVALID] = BLANK
+    return key
+
+
+def grade(matrix, key):
+    """
+    Tüm öğrencileri tek seferde puanlar.
+    Öğrenci başına doğru/yanlış/boş sayıları ve yüzde; soru başına doğru oranı, boş oranı,
+    şık dağılımı ve en çok seçilen yanlış şık döndürülür.
+    """
+    student_count, question_count = matrix.shape
+    answered = matrix != BLANK
+    correct = (matrix == key) & (key != BLANK)
+
+    correct_counts = correct.sum(axis=1)
+    answered_counts = answered.sum(axis=1)
+    students = {
+        "correct": correct_counts,
+        "incorrect": answered_counts - correct_counts,
+        "unanswered": question_count - answered_counts,
+        "percentage": correct_counts * 100.0 / question_count if question_count else np.zeros(student_count),
+    }
+
+    # Şık dağılımı: (soru x şık) sayıları; anahtarın olduğu sütun yanlışlar arasında sayılmaz
+    choice_counts = (matrix[:, :, None] == np.arange(1, len(LETTERS) + 1, dtype=np.uint8)).sum(axis=0)
+    wrong_counts = choice_counts.copy()
+    has_key = key != BLANK
+    wrong_counts[np.flatnonzero(has_key), key[has_key].astype(np.intp) - 1] = 0
+    top_wrong = wrong_counts.argmax(axis=1)
+    top_wrong_counts = wrong_counts[np.arange(question_count), top_wrong]
+    divisor = max(student_count, 1)
+    questions = {
+        "accuracy": correct.sum(axis=0) / divisor,
+        "blank_rate": (~answered).sum(axis=0) / divisor,
+        "choice_counts": choice_counts,
+        "most_common_wrong": np.where(top_wrong_counts > 0, top_wrong + 1, BLANK).astype(np.uint8),
+        "most_common_wrong_count": top_wrong_counts,
+    }
+    return students, questions
+
+
+def _letter(code):
+    return LETTERS[code - 1].upper() if BLANK < code <= len(LETTERS) else ""
+
+
+def write_student_scores(path, student_ids, students):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["ogrenci", "dogru", "yanlis", "bos", "yuzde"])
+        for i, student_id in enumerate(student_ids):
+            writer.writerow([
+                student_id, int(students["correct"][i]), int(students["incorrect"][i]),
+                int(students["unanswered"][i]), f"{students['percentage'][i]:.2f}",
+            ])
+
+
+def write_question_stats(path, question_numbers, key, questions):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["soru", "anahtar", "dogru_orani", "bos_orani", "en_cok_secilen_yanlis", "adet"]
+                        + [f"secim_{letter.upper()}" for letter in LETTERS])
+        for j, number in enumerate(question_numbers):
+            writer.writerow([
+                number, _letter(key[j]), f"{questions['accuracy'][j]:.3f}", f"{questions['blank_rate'][j]:.3f}",
+                _letter(questions["most_common_wrong"][j]), int(questions["most_common_wrong_count"][j]),
+            ] + [int(c) for c in questions["choice_counts"][j]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cevap kâğıtlarını cevap anahtarına göre toplu puanlar")
+    parser.add_argument("submissions", help="Cevap kâğıtları (CSV veya JSONL)")
+    parser.add_argument("--answers", default=pick_source(ANSWER_SOURCES), help="Cevap anahtarı (TXT, DOCX veya PDF)")
+    parser.add_argument("--students-out", help="Öğrenci puanlarının yazılacağı CSV")
+    parser.add_argument("--questions-out", help="Soru istatistiklerinin yazılacağı CSV")
+    args = parser.parse_args(argv)
+
+    student_ids, question_numbers, submissions = read_submissions(args.submissions)
+    if not student_ids or not question_numbers:
+        print("Puanlanacak cevap kâğıdı bulunamadı.", file=sys.stderr)
+        return 1
+    answers = load_answers(args.answers)
+
+    matrix = build_matrix(question_numbers, submissions)
+    key = build_key(question_numbers, answers)
+    start = time.perf_counter()
+    students, questions = grade(matrix, key)
+    elapsed = time.perf_counter() - start
+
+    missing = [number for number, code in zip(question_numbers, key) if code == BLANK]
+    print(f"{len(student_ids)} öğrenci x {len(question_numbers)} soru {elapsed * 1000:.2f} ms'de puanlandı.")
+    print(f"Ortalama: {students['percentage'].mean():.2f}% | Medyan: {np.median(students['percentage']):.2f}%")
+    if missing:
+        print(f"Anahtarı olmayan {len(missing)} soru (doğru sayılamaz): {', '.join(missing[:30])}")
+    hardest = np.argsort(questions["accuracy"], kind="stable")[:5]
+    print("En zor sorular: " + ", ".join(
+        f"{question_numbers[j]} (%{questions['accuracy'][j] * 100:.0f})" for j in hardest
+    ))
+
+    if args.students_out:
+        write_student_scores(args.students_out, student_ids, students)
+    if args.questions_out:
+        write_question_stats(args.questions_out, question_numbers, key, questions)
+    if not (args.students_out or args.questions_out):
+        for i, student_id in enumerate(student_ids[:20]):
+            print(f"  {student_id}: {int(students['correct'][i])} doğru, {int(students['incorrect'][i])} yanlış, "
+                  f"{int(students['unanswered'][i])} boş ({students['percentage'][i]:.2f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
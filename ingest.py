@@ -0,0 +1,193 @@
+"""
+Soru bankasını sunucu dışında derleyen komut satırı aracı.
+
+Soru ve cevap kaynaklarını ayrıştırır, neredeyse aynı soruları tarar ve derlenmiş bankayı
+(anlık görüntü) .bank_cache klasörüne yazar; uygulama bu dosyayı doğrudan okur ve hiçbir kaynak
+dosyayı ayrıştırmaz. Aynı geçişte cevap anahtarı ile sorular çapraz doğrulanır:
+anahtarı olmayan sorular, sorusu olmayan anahtarlar, dört şıktan az/çok şıkkı olan sorular,
+tekrarlanan soru numaraları ve çelişen anahtar satırları raporlanır.
+Her sorunun şekil PDF'indeki (PDF kaynaklarda kendisi, DOCX/TXT kaynaklarda aynı klasördeki eş PDF
+veya --figures) sayfası ve bölgesi de kaydedilir; --render-figures ile şekilli soruların
+görüntüleri şekil önbelleğine önceden çizilir.
+
+Kullanım:
+    python ingest.py
+    python ingest.py --catalog bankalar.json --strict
+    python ingest.py --questions sorular_ve_siklar.pdf --answers dogru_cevaplar.pdf --workers 4 --strict
+    python ingest.py --questions sorular_ve_siklar.pdf --render-figures
+"""
+import argparse
+import json
+import sys
+from collections import Counter
+
+from bank_catalog import DEFAULT_BANK_ID, load_catalog, source_paths
+from bank_snapshot import SNAPSHOT_DIR, source_fingerprint, save_snapshot
+from dedup import DEFAULT_THRESHOLD, find_duplicate_clusters, format_report
+from figures import FIGURE_CACHE_DIR, FIGURE_DPI, FigureCache
+from loaders import QUESTION_SOURCES, ANSWER_SOURCES, pick_source, figure_source, load_questions, load_answer_entries
+
+
+EXPECTED_OPTION_COUNT = 4
+
+
+def _number_key(number):
+    return (0, int(number)) if number.isdigit() else (1, number)
+
+
+def validate_bank(questions, answer_entries, skipped=()):
+    """
+    Sorular ile cevap anahtarını tek geçişte çapraz doğrular.
+    answer_entries, anahtar dosyasındaki (soru no, harf) satırlarıdır; tekrarlar da dahil edilir.
+    Sonuç, her sorun türü için soru numaralarının sıralı listelerini içeren bir sözlüktür.
+    """
+    question_numbers = Counter(q["number"] for q in questions)
+    answers = {}
+    conflicting = set()
+    for number, letter in answer_entries:
+        if answers.setdefault(number, letter) != letter:
+            conflicting.add(number)
+
+    return {
+        "question_count": len(questions),
+        "answer_count": len(answers),
+        "skipped_blocks": list(skipped),
+        "missing_answers": sorted((n for n in question_numbers if n not in answers), key=_number_key),
+        "orphan_answers": sorted((n for n in answers if n not in question_numbers), key=_number_key),
+        "bad_option_counts": [
+            [q["number"], len(q["options"])] for q in questions if len(q["options"]) != EXPECTED_OPTION_COUNT
+        ],
+        "duplicate_numbers": sorted((n for n, c in question_numbers.items() if c > 1), key=_number_key),
+        "conflicting_answers": sorted(conflicting, key=_number_key),
+    }
+
+
+def has_problems(report):
+    return any(report[key] for key in (
+        "skipped_blocks", "missing_answers", "orphan_answers", "bad_option_counts",
+        "duplicate_numbers", "conflicting_answers",
+    ))
+
+
+def format_validation_report(report):
+    def numbers(values, limit=30):
+        shown = ", ".join(values[:limit])
+        return shown + (f" ... (+{len(values) - limit})" if len(values) > limit else "")
+
+    lines = [f"{report['question_count']} soru, {report['answer_count']} cevap anahtarı."]
+    if report["skipped_blocks"]:
+        lines.append(f"Formatı eşleşmeyen {len(report['skipped_blocks'])} blok atlandı:")
+        lines.extend(f"  {line[:70]}" for line in report["skipped_blocks"][:10])
+    if report["missing_answers"]:
+        lines.append(f"Cevap anahtarı olmayan {len(report['missing_answers'])} soru: {numbers(report['missing_answers'])}")
+    if report["orphan_answers"]:
+        lines.append(f"Sorusu olmayan {len(report['orphan_answers'])} anahtar: {numbers(report['orphan_answers'])}")
+    if report["bad_option_counts"]:
+        details = [f"{number} ({count} şık)" for number, count in report["bad_option_counts"]]
+        lines.append(f"Şık sayısı {EXPECTED_OPTION_COUNT} olmayan {len(details)} soru: {numbers(details)}")
+    if report["duplicate_numbers"]:
+        lines.append(f"Birden fazla kez geçen soru numaraları: {numbers(report['duplicate_numbers'])}")
+    if report["conflicting_answers"]:
+        lines.append(f"Farklı cevaplarla tekrarlanan anahtarlar: {numbers(report['conflicting_answers'])}")
+    if not has_problems(report):
+        lines.append("Sorun bulunamadı.")
+    return "\n".join(lines)
+
+
+def ingest(questions_path, answers_path, workers=1, dedup_threshold=DEFAULT_THRESHOLD, directory=SNAPSHOT_DIR,
+           figures_path=None):
+    """
+    Kaynakları ayrıştırır, doğrular ve derlenmiş bankayı yazar (figures_path: şekil bölgelerinin PDF'i).
+    (anlık görüntü yolu, doğrulama raporu, kopya kümeleri, sorular) döndürür; kaynaklardan biri
+    okunamadıysa veya boşsa anlık görüntü yazılmaz ve yol None olur.
+    """
+    skipped = []
+    questions = load_questions(questions_path, workers=workers, on_skip=skipped.append, figures_path=figures_path)
+    answer_entries = load_answer_entries(answers_path)
+    report = validate_bank(questions, answer_entries, skipped)
+    duplicates = find_duplicate_clusters(questions, dedup_threshold) if dedup_threshold else []
+
+    path = None
+    fingerprint = source_fingerprint(*source_paths(questions_path, answers_path, figures_path))
+    if questions and answer_entries:
+        path = save_snapshot(fingerprint, questions, dict(answer_entries), duplicates, directory)
+    return path, report, duplicates, questions
+
+
+def _ingest_one(label, questions_path, answers_path, figures_path, args):
+    """Tek bir bankayı derler, raporunu yazdırır; (çıkış kodu, JSON raporu) döndürür."""
+    print(f"== {label}: {questions_path} + {answers_path}")
+    try:
+        path, report, duplicates, questions = ingest(
+            questions_path, answers_path, args.workers, args.dedup_threshold, args.output_dir, figures_path,
+        )
+    except OSError as e:
+        print(f"Kaynak dosya okunamadı: {e}", file=sys.stderr)
+        return 2, None
+
+    print(format_validation_report(report))
+    if args.show_duplicates:
+        print(format_report(questions, duplicates))
+    else:
+        print(f"{len(duplicates)} kopya soru kümesi bulundu.")
+    if path is None:
+        print("Derlenmiş banka yazılmadı: sorular veya cevaplar boş.", file=sys.stderr)
+        return 2, report
+    print(f"Derlenmiş banka: {path}")
+    if args.render_figures:
+        # Şekiller önceden çizilir; sunucuda her şekil ilk istekte bile yalnızca dosyadan okunur
+        cache = FigureCache(args.figure_cache, dpi=args.figure_dpi)
+        figures = [q for q in questions if q.get("has_figure")]
+        for question in figures:
+            cache.get(figures_path, question["region"])
+        print(f"{len(figures)} soru şekli {args.figure_cache} klasörüne çizildi.")
+
+    report["duplicates"] = [[questions[i]["number"] for i in cluster] for cluster in duplicates]
+    return (1 if args.strict and has_problems(report) else 0), report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soru bankasını derler ve cevap anahtarıyla çapraz doğrular")
+    parser.add_argument("--questions", default=pick_source(QUESTION_SOURCES), help="Soru dosyası (DOCX, TXT veya PDF)")
+    parser.add_argument("--answers", default=pick_source(ANSWER_SOURCES), help="Cevap anahtarı (TXT, DOCX veya PDF)")
+    parser.add_argument("--figures", help="Şekillerin kırpılacağı PDF (varsayılan: soru PDF'i veya yanındaki eş PDF)")
+    parser.add_argument("--catalog", help="Banka kataloğu (JSON); verilirse katalogdaki bankalar derlenir")
+    parser.add_argument("--bank", action="append", help="Katalogdan yalnızca bu bankayı derle (tekrarlanabilir)")
+    parser.add_argument("--workers", type=int, default=1, help="PDF sayfa metinleri için süreç sayısı")
+    parser.add_argument("--dedup-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Kopya soru benzerlik eşiği (0 = kopya taraması yapma)")
+    parser.add_argument("--show-duplicates", action="store_true", help="Kopya kümelerini ayrıntılı yazdır")
+    parser.add_argument("--output-dir", default=SNAPSHOT_DIR, help="Derlenmiş bankanın yazılacağı klasör")
+    parser.add_argument("--render-figures", action="store_true", help="PDF kaynaklı şekilleri önbelleğe önceden çiz")
+    parser.add_argument("--figure-cache", default=FIGURE_CACHE_DIR, help="Şekil önbelleği klasörü")
+    parser.add_argument("--figure-dpi", type=int, default=FIGURE_DPI, help="Şekil çizim çözünürlüğü")
+    parser.add_argument("--json", dest="json_path", help="Doğrulama raporlarını ayrıca bu JSON dosyasına yaz")
+    parser.add_argument("--strict", action="store_true", help="Herhangi bir sorun bulunursa hata koduyla çık")
+    args = parser.parse_args(argv)
+
+    if args.catalog:
+        catalog = load_catalog(args.catalog)
+        unknown = [bank_id for bank_id in args.bank or () if bank_id not in catalog]
+        if unknown:
+            parser.error(f"Katalogda olmayan banka: {', '.join(unknown)}")
+        specs = [catalog[bank_id] for bank_id in args.bank] if args.bank else list(catalog.values())
+        jobs = [(spec.id, spec.questions_path, spec.answers_path, spec.figures_path) for spec in specs]
+    else:
+        jobs = [(DEFAULT_BANK_ID, args.questions, args.answers, args.figures or figure_source(args.questions))]
+
+    exit_code = 0
+    reports = {}
+    for label, questions_path, answers_path, figures_path in jobs:
+        code, report = _ingest_one(label, questions_path, answers_path, figures_path, args)
+        exit_code = max(exit_code, code)
+        if report is not None:
+            reports[label] = report
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import os
+import re
+
+from parsers import (
+    iter_pdf_pages, iter_pdf_pages_parallel, iter_questions, iter_answers, locate_question_regions, read_page_layouts,
+)
+
+
+# Dosya uzantısı -> yükleyici fonksiyon. Tanınmayan uzantılar için PDF yükleyicisi kullanılır.
+QUESTION_LOADERS = {}
+ANSWER_LOADERS = {}
+FALLBACK_EXTENSION = ".pdf"
+# Varsayılan kaynak dosyalar; ucuz formatlar (DOCX, düz metin) önce denenir, yoksa PDF'e düşülür
+QUESTION_SOURCES = ("sorular.docx", "sorular_ve_siklar.pdf")
+ANSWER_SOURCES = ("cevaplar.txt", "dogru_cevaplar.pdf")
+# Soru metni PDF dışı bir kaynaktan okunduğunda, şekillerin kırpılacağı eş PDF (aynı klasörde aranır)
+FIGURE_SOURCES = ("sorular_ve_siklar.pdf",)
+
+# Metin cevap anahtarı satırı: "500: A", "501. c", "502) B"; "877: [Cevap Yok]" gibi satırlar atlanır
+ANSWER_LINE_PATTERN = re.compile(r"^\s*(\d+)\s*[.:)]\s*([A-D])\b", re.IGNORECASE)
+
+
+def _extension(path):
+    return os.path.splitext(path)[1].lower()
+
+
+def register_question_loader(*extensions):
+    """Soru bankası yükleyicisini verilen uzantılar için kaydeden dekoratör."""
+    def decorator(func):
+        for ext in extensions:
+            QUESTION_LOADERS[ext.lower()] = func
+        return func
+    return decorator
+
+
+def register_answer_loader(*extensions):
+    """Cevap anahtarı yükleyicisini verilen uzantılar için kaydeden dekoratör."""
+    def decorator(func):
+        for ext in extensions:
+            ANSWER_LOADERS[ext.lower()] = func
+        return func
+    return decorator
+
+
+def pick_source(candidates):
+    """
+    Aday dosyalardan ilk var olanı döndürür (ucuz formatlar önce yazılmalıdır).
+    Hiçbiri yoksa son aday döner; böylece hata mesajı anlamlı bir dosya adı gösterir.
+    """
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return candidates[-1]
+
+
+def figure_source(questions_path, candidates=FIGURE_SOURCES):
+    """
+    Soruların şekillerinin kırpılacağı PDF: kaynak zaten PDF ise kendisi, değilse aynı klasördeki
+    ilk var olan eş PDF; hiçbiri yoksa None (banka şekilsiz sunulur).
+    """
+    if _extension(questions_path) == ".pdf":
+        return questions_path
+    directory = os.path.dirname(questions_path)
+    for name in candidates:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_questions(path, workers=1, on_skip=None, figures_path=None):
+    """
+    Dosya türüne uygun yükleyiciyle soruları ayrıştırıp liste olarak döndürür.
+    figures_path, soru metni PDF dışı bir kaynaktan okunuyorsa soruların sayfa ve bölgelerinin
+    (şekiller için) alınacağı eş PDF'tir; PDF kaynaklarda bölgeler zaten metinle aynı geçişte bulunur.
+    """
+    loader = QUESTION_LOADERS.get(_extension(path), QUESTION_LOADERS[FALLBACK_EXTENSION])
+    questions = list(loader(path, workers=workers, on_skip=on_skip))
+    if figures_path and figures_path != path and not any(q.get("region") for q in questions):
+        locate_question_regions(questions, read_page_layouts(figures_path))
+    return questions
+
+
+def load_answer_entries(path):
+    """Cevap anahtarının tüm (soru no, harf) satırlarını dosyadaki sırasıyla döndürür (tekrarlar dahil)."""
+    loader = ANSWER_LOADERS.get(_extension(path), ANSWER_LOADERS[FALLBACK_EXTENSION])
+    return list(loader(path))
+
+
+def load_answers(path):
+    """Dosya türüne uygun yükleyiciyle cevap anahtarını {soru no: harf} olarak döndürür."""
+    return dict(load_answer_entries(path))
+
+
+def _iter_docx_paragraphs(path):
+    import docx # python-docx yalnızca DOCX kaynağı okunurken gerekir
+
+    for paragraph in docx.Document(path).paragraphs:
+        yield paragraph.text + "\n"
+
+
+def _iter_text_lines(path):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        yield from f
+
+
+@register_question_loader(".pdf")
+def load_questions_from_pdf(path, workers=1, on_skip=None):
+    # Şekillerin kaynaktan kırpılabilmesi için her sorunun sayfası ve bölgesi de kaydedilir;
+    # sayfa yerleşimleri metinle aynı geçişte (paralel okumada işçilerde) çıkarılır
+    layouts = []
+    pages = iter_pdf_pages_parallel(path, workers, layouts=layouts) if workers > 1 else iter_pdf_pages(path, layouts)
+    questions = list(iter_questions(pages, on_skip=on_skip))
+    return locate_question_regions(questions, layouts)
+
+
+@register_question_loader(".docx")
+def load_questions_from_docx(path, workers=1, on_skip=None):
+    # Her paragraf bir "sayfa" gibi akışa verilir; yarım kalan soru bir sonrakine taşınır
+    return iter_questions(_iter_docx_paragraphs(path), on_skip=on_skip)
+
+
+@register_question_loader(".txt")
+def load_questions_from_text(path, workers=1, on_skip=None):
+    return iter_questions(_iter_text_lines(path), on_skip=on_skip)
+
+
+@register_answer_loader(".txt")
+def load_answers_from_text(path):
+    """Satır satır okunan düz metin cevap anahtarı; PDF işlemeye göre çok daha ucuzdur."""
+    for line in _iter_text_lines(path):
+        match = ANSWER_LINE_PATTERN.match(line)
+        if match:
+            yield match.group(1), match.group(2).lower()
+
+
+@register_answer_loader(".pdf")
+def load_answers_from_pdf(path):
+    return iter_answers(iter_pdf_pages(path))
+
+
+@register_answer_loader(".docx")
+def load_answers_from_docx(path):
+    return iter_answers(_iter_docx_paragraphs(path))
@@ -0,0 +1,223 @@
+import cProfile
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Ölçümler süreç içinde toplanır; ISG_METRICS_FILE verilirse Prometheus metin biçiminde
+# bu dosyaya, ISG_METRICS_LOG=1 ise log'a periyodik olarak yazılır.
+METRICS_FILE = os.environ.get("ISG_METRICS_FILE")
+METRICS_LOG = os.environ.get("ISG_METRICS_LOG") == "1"
+DUMP_INTERVAL = float(os.environ.get("ISG_METRICS_INTERVAL", "10"))
+# Yalnızca bu oturum belirtecine sahip oturum cProfile ile profillenir
+PROFILE_SESSION = os.environ.get("ISG_PROFILE_SESSION")
+PROFILE_DIR = os.environ.get("ISG_PROFILE_DIR", "profiles")
+
+# Süre (saniye) ve adet histogramları için kova sınırları
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 3, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Bir etkileşimin kaç yeniden çalıştırma zinciri sürdüğünü izlemek için oturum anahtarı
+CHAIN_KEY = "_metrics_run_chain"
+# Oturumda şu an ölçülen bir çalıştırma varsa kapsamı (iç içe çağrılar yalnızca span olur)
+ACTIVE_KEY = "_metrics_active_scope"
+
+logger = logging.getLogger("isg.metrics")
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_last_dump = time.monotonic()
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def inc(name, value=1, **labels):
+    """Sayaç değerini artırır."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name, value, buckets=SECONDS_BUCKETS, **labels):
+    """Histograma bir gözlem ekler (adet, toplam, en büyük ve kova sayıları tutulur)."""
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = {"buckets": buckets, "counts": [0] * len(buckets), "count": 0, "sum": 0.0, "max": 0.0}
+        hist["count"] += 1
+        hist["sum"] += value
+        hist["max"] = max(hist["max"], value)
+        for i, bound in enumerate(hist["buckets"]):
+            if value <= bound:
+                hist["counts"][i] += 1
+                break
+
+
+@contextmanager
+def span(name, **labels):
+    """Bloğun süresini isg_span_seconds{span=name} histogramına yazar."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe("isg_span_seconds", time.perf_counter() - start, span=name, **labels)
+
+
+def timed(name):
+    """Fonksiyonun her çağrısını span(name) ile ölçen dekoratör."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _elements_emitted():
+    """
+    Bu çalıştırmada kök konteynerlere (ana sayfa, kenar çubuğu) eklenen öğe sayısı.
+    Streamlit çalışma bağlamı yoksa (ör. komut satırı) None döner.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is None:
+            return None
+        return sum(cursor.index for cursor in ctx.cursors.values())
+    except Exception:
+        return None
+
+
+@contextmanager
+def script_run(scope, session_state, profile=False):
+    """
+    Bir betik (veya fragment) çalıştırmasını ölçer: süre, gönderilen öğe sayısı ve
+    bir kullanıcı etkileşiminin kaç ardışık çalıştırma sürdüğü (st.rerun zinciri).
+    profile=True ise çalıştırma cProfile ile profillenir ve oturumun dosyasına eklenir.
+    Tam sayfa çalıştırması içinde çağrılan bir fragment yalnızca span olarak ölçülür.
+    """
+    if session_state.get(ACTIVE_KEY):
+        with span(scope):
+            yield
+        return
+
+    chain = session_state.get(CHAIN_KEY, 0) + 1
+    session_state[CHAIN_KEY] = chain
+    inc("isg_script_runs_total", scope=scope)
+
+    profiler = cProfile.Profile() if profile else None
+    rerun_requested = False
+    start = time.perf_counter()
+    session_state[ACTIVE_KEY] = scope
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    except BaseException as exc:
+        # st.rerun() bir kontrol istisnası fırlatır; etkileşim bir sonraki çalıştırmada sürer
+        rerun_requested = type(exc).__name__ == "RerunException"
+        if rerun_requested:
+            inc("isg_reruns_requested_total", scope=scope)
+        raise
+    finally:
+        session_state[ACTIVE_KEY] = None
+        if profiler is not None:
+            profiler.disable()
+            _save_profile(profiler, session_state)
+        observe("isg_script_run_seconds", time.perf_counter() - start, scope=scope)
+        elements = _elements_emitted()
+        if elements is not None:
+            observe("isg_elements_emitted", elements, buckets=COUNT_BUCKETS, scope=scope)
+        if not rerun_requested:
+            observe("isg_runs_per_interaction", chain, buckets=COUNT_BUCKETS)
+            session_state[CHAIN_KEY] = 0
+        maybe_dump()
+
+
+def _save_profile(profiler, session_state):
+    """Oturumun profil verisini biriktirir ve tek bir .prof dosyasına yazar."""
+    import pstats
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = os.path.join(PROFILE_DIR, f"{PROFILE_SESSION}.prof")
+    stats = session_state.get("_metrics_profile_stats")
+    if stats is None:
+        stats = pstats.Stats(profiler)
+        session_state["_metrics_profile_stats"] = stats
+    else:
+        stats.add(profiler)
+    stats.dump_stats(path)
+
+
+def render_prometheus():
+    """Toplanan tüm ölçümleri Prometheus metin biçiminde döndürür."""
+    def fmt_labels(labels, extra=()):
+        items = list(labels) + list(extra)
+        if not items:
+            return ""
+        return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+    with _lock:
+        counters = dict(_counters)
+        histograms = {k: dict(v, counts=list(v["counts"])) for k, v in _histograms.items()}
+
+    lines = []
+    for name in sorted({n for n, _ in counters}):
+        lines.append(f"# TYPE {name} counter")
+        for (n, labels), value in sorted(counters.items()):
+            if n == name:
+                lines.append(f"{name}{fmt_labels(labels)} {value}")
+    for name in sorted({n for n, _ in histograms}):
+        lines.append(f"# TYPE {name} histogram")
+        for (n, labels), hist in sorted(histograms.items()):
+            if n != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(hist["buckets"], hist["counts"]):
+                cumulative += count
+                lines.append(f"{name}_bucket{fmt_labels(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_bucket{fmt_labels(labels, [('le', '+Inf')])} {hist['count']}")
+            lines.append(f"{name}_sum{fmt_labels(labels)} {hist['sum']}")
+            lines.append(f"{name}_count{fmt_labels(labels)} {hist['count']}")
+        # En büyük değer histogramın parçası olamaz, ayrı bir gauge olarak yazılır
+        lines.append(f"# TYPE {name}_max gauge")
+        for (n, labels), hist in sorted(histograms.items()):
+            if n == name:
+                lines.append(f"{name}_max{fmt_labels(labels)} {hist['max']}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path):
+    """Ölçümleri dosyaya yazar (geçici dosya + os.replace; okuyucu hiçbir zaman yarım dosya görmez)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+def maybe_dump():
+    """Yapılandırılmışsa ölçümleri en fazla DUMP_INTERVAL saniyede bir dosyaya/log'a yazar."""
+    global _last_dump
+    if not (METRICS_FILE or METRICS_LOG):
+        return
+    now = time.monotonic()
+    with _lock:
+        if now - _last_dump < DUMP_INTERVAL:
+            return
+        _last_dump = now
+    if METRICS_FILE:
+        try:
+            dump(METRICS_FILE)
+        except OSError:
+            logger.exception("Ölçümler %s dosyasına yazılamadı", METRICS_FILE)
+    if METRICS_LOG:
+        logger.info("İSG ölçümleri:\n%s", render_prometheus())
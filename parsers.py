@@ -0,0 +1,252 @@
+import math
+import multiprocessing
+import os
+import re
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+# PyMuPDF (fitz) modül düzeyinde içe aktarılmaz; yalnızca bir PDF gerçekten okunurken
+# (önbellek ıskalamasında veya derleme sırasında) fonksiyonların içinde yüklenir.
+
+
+# Soru numarasını, metnini ve ardından gelen şıkları yakalamak için genel desen
+# (\d+[.)]\s*.+?) : Soru numarası (örn: 1.), soru metni ve şıklar
+# (?=\s*\d+[.)]|\Z) : Yeni bir soru numarası veya metin sonu gelene kadar devam et
+QUESTION_BLOCK_PATTERN = re.compile(r"(\d+[.)]\s*.+?)(?=\s*\d+[.)]|\Z)", re.DOTALL)
+QUESTION_LINE_PATTERN = re.compile(r"^\s*(\d+)[.)]\s*(.*)")
+# Şık harfini, noktayı/parantezi ve metni yakalar (örn: "A) Şık metni", "B. Şık metni")
+OPTION_LINE_PATTERN = re.compile(r"^\s*([a-d])([.)])\s*(.*)", re.IGNORECASE)
+# Soru numarasını ve cevabı yakalar: örn "500. A", "501) C" veya "502: B"
+ANSWER_PATTERN = re.compile(r"(\d+)[.:)]\s*([A-D])", re.IGNORECASE)
+# Soru bölgesindeki çizimlerin/resimlerin birleşik alanı her iki yönde bundan büyükse soru şekilli sayılır
+# (tek bir alt çizgi veya ayraç çizgisi şekil sayılmaz; tablolar ve işaretler sayılır)
+FIGURE_MIN_SIZE = 20
+REGION_PADDING = 4
+
+
+def iter_pdf_pages(pdf_path, layouts=None):
+    """
+    PDF'in sayfa metinlerini tek tek üretir.
+    Tüm belge metni hiçbir zaman tek bir string olarak bellekte tutulmaz.
+    layouts bir liste ise her sayfanın yerleşimi (page_layout) de aynı geçişte listeye eklenir.
+    """
+    import fitz
+
+    doc = fitz.open(pdf_path)
+    try:
+        for page in doc:
+            if layouts is not None:
+                layouts.append(page_layout(page))
+            yield page.get_text("text", sort=True)
+    finally:
+        doc.close() # Belgeyi kapatmayı unutmayın
+
+
+def _extract_page_range(page_range):
+    """
+    İşçi süreçte çalışır: belgeyi kendisi açar ve verilen sayfa aralığının metinlerini
+    (istenmişse her sayfanın yerleşimiyle birlikte (metin, yerleşim) olarak) döndürür.
+    """
+    import fitz
+
+    pdf_path, start, stop, with_layout = page_range
+    doc = fitz.open(pdf_path)
+    try:
+        if with_layout:
+            return [(doc[i].get_text("text", sort=True), page_layout(doc[i])) for i in range(start, stop)]
+        return [doc[i].get_text("text", sort=True) for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def iter_pdf_pages_parallel(pdf_path, workers=None, pages_per_chunk=None, layouts=None):
+    """
+    PDF sayfa metinlerini bir süreç havuzunda paralel çıkarır ve sayfa sırasıyla üretir.
+    Sayfa sınırında bölünen sorular, çıktıyı tüketen iter_question_blocks tarafından
+    birleştirilir. workers=1 veya tek parçalık belgelerde sıralı okumaya düşer.
+    layouts bir liste ise sayfa yerleşimleri de işçilerde çıkarılıp sayfa sırasıyla eklenir.
+    """
+    import fitz
+
+    workers = workers or os.cpu_count() or 1
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+
+    if pages_per_chunk is None:
+        # Yük dengesi için işçi başına birkaç parça
+        pages_per_chunk = max(1, math.ceil(page_count / (workers * 4)))
+    if workers <= 1 or page_count <= pages_per_chunk:
+        yield from iter_pdf_pages(pdf_path, layouts)
+        return
+
+    ranges = [
+        (pdf_path, start, min(start + pages_per_chunk, page_count), layouts is not None)
+        for start in range(0, page_count, pages_per_chunk)
+    ]
+    # Streamlit iş parçacıklarıyla çakışmaması için "spawn" bağlamı kullanılır
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # map sonuçları gönderim sırasıyla döndürür; sayfa sırası korunur
+        for texts in pool.map(_extract_page_range, ranges):
+            if layouts is None:
+                yield from texts
+                continue
+            for text, layout in texts:
+                layouts.append(layout)
+                yield text
+
+
+def iter_question_blocks(page_texts):
+    """
+    Sayfa metinlerinden ham soru bloklarını (numara + metin + şıklar) sırayla üretir.
+    Sayfanın son bloğu bir sonraki sayfada devam edebileceği için bitmiş sayılmaz;
+    sayfalar arasında yalnızca bu yarım kalan blok taşınır.
+    """
+    carry = ""
+    for page_text in page_texts:
+        buffer = carry + page_text
+        last_match = None
+        for match in QUESTION_BLOCK_PATTERN.finditer(buffer):
+            if last_match is not None:
+                yield last_match.group(1)
+            last_match = match
+        # Son blok sayfa sonuna kadar uzanıyor, sonraki sayfayla birlikte yeniden değerlendirilir
+        carry = buffer[last_match.start():] if last_match is not None else ""
+
+    if carry:
+        for match in QUESTION_BLOCK_PATTERN.finditer(carry):
+            yield match.group(1)
+
+
+def parse_question_block(block, on_skip=None):
+    """
+    Tek bir soru bloğunu {"number", "question", "options"} sözlüğüne dönüştürür.
+    Blok soru formatına uymuyorsa on_skip (verildiyse) ilk satırla çağrılır ve None döner.
+    """
+    lines = [line.strip() for line in block.split('\n') if line.strip()]
+    if not lines:
+        return None
+
+    # İlk satırın soru numarası ve metni olduğunu varsayalım
+    question_line = lines[0]
+    question_num_match = QUESTION_LINE_PATTERN.match(question_line)
+    if not question_num_match:
+        if on_skip is not None:
+            on_skip(question_line)
+        return None
+
+    question_number = question_num_match.group(1).strip()
+    # question_text'i ilk satırın geri kalanından başlat
+    question_text_parts = [question_num_match.group(2).strip()]
+    options = []
+
+    # Kalan satırları işle (çok satırlı soru metni veya şıklar)
+    for line in lines[1:]:
+        if OPTION_LINE_PATTERN.match(line):
+            options.append(line)
+        else:
+            # Şık değilse, soru metnine ekle
+            question_text_parts.append(line)
+
+    return {
+        "number": question_number,
+        "question": " ".join(question_text_parts).strip(),
+        "options": options,
+    }
+
+
+def iter_questions(page_texts, on_skip=None):
+    """Sayfa metinleri okundukça ayrıştırılmış soruları üretir."""
+    for block in iter_question_blocks(page_texts):
+        question = parse_question_block(block, on_skip)
+        if question is not None:
+            yield question
+
+
+def page_layout(page):
+    """
+    Soru bölgelerinin bulunması için sayfanın yerleşimi, süreçler arasında taşınabilir demetler olarak:
+    (sayfa dikdörtgeni, [(satır dikdörtgeni, satır soru numarasıyla başlıyorsa numara, yoksa None)],
+    [çizim ve resim dikdörtgenleri]). Satırlar okuma sırasıyladır.
+    """
+    lines = []
+    for block in page.get_text("dict", sort=True)["blocks"]:
+        for line in block.get("lines", ()):
+            match = QUESTION_LINE_PATTERN.match("".join(span["text"] for span in line["spans"]))
+            lines.append((tuple(line["bbox"]), match.group(1) if match else None))
+    graphics = [tuple(drawing["rect"]) for drawing in page.get_drawings()]
+    for image in page.get_images(full=True):
+        graphics.extend(tuple(rect) for rect in page.get_image_rects(image[0]))
+    return tuple(page.rect), lines, graphics
+
+
+def read_page_layouts(pdf_path):
+    """PDF'in tüm sayfalarının yerleşimleri (metni başka bir kaynaktan okunan bankalar için)."""
+    import fitz
+
+    with fitz.open(pdf_path) as doc:
+        return [page_layout(page) for page in doc]
+
+
+def locate_question_regions(questions, page_layouts):
+    """
+    Soruların kaynak PDF'teki yerini sayfa yerleşimlerinden (page_layout) bulur ve her soruya
+    "region" ([sayfa, x0, y0, x1, y1], punto) ile "has_figure" ekler. Bölge, sorunun numara
+    satırından aynı sayfadaki bir sonraki sorunun numara satırına (yoksa sayfa sonuna) kadar uzanır;
+    sayfa sınırında bölünen sorunun yalnızca ilk sayfadaki kısmı alınır. Numaralar soru sırasıyla
+    aranır; bulunamayan soru bölgesiz kalır.
+    """
+    import fitz
+
+    positions = defaultdict(deque)
+    for position, question in enumerate(questions):
+        positions[question["number"]].append(position)
+
+    next_position = 0
+    for page_number, (page_rect, lines, graphics) in enumerate(page_layouts):
+        anchors = [] # (soru sırası, satır indeksi)
+        for line_index, (_, number) in enumerate(lines):
+            if number is None:
+                continue
+            candidates = positions.get(number)
+            while candidates and candidates[0] < next_position:
+                candidates.popleft()
+            if candidates:
+                anchors.append((candidates.popleft(), line_index))
+                next_position = anchors[-1][0] + 1
+        if not anchors:
+            continue
+
+        page_rect = fitz.Rect(page_rect)
+        for n, (position, line_index) in enumerate(anchors):
+            top = lines[line_index][0][1]
+            bottom = lines[anchors[n + 1][1]][0][1] if n + 1 < len(anchors) else page_rect.y1
+            region = fitz.Rect()
+            for rect, _ in lines[line_index:anchors[n + 1][1] if n + 1 < len(anchors) else len(lines)]:
+                region |= rect
+            figure = fitz.Rect()
+            for rect in map(fitz.Rect, graphics):
+                if rect.y1 > top and rect.y0 < bottom:
+                    figure |= rect & fitz.Rect(page_rect.x0, top, page_rect.x1, bottom)
+            region |= figure
+            region = (region + (-REGION_PADDING, -REGION_PADDING, REGION_PADDING, REGION_PADDING)) & page_rect
+            questions[position]["region"] = [page_number] + [round(v, 1) for v in region]
+            questions[position]["has_figure"] = figure.width > FIGURE_MIN_SIZE and figure.height > FIGURE_MIN_SIZE
+    return questions
+
+
+def iter_answers(page_texts):
+    """
+    Sayfa metinlerinden (soru numarası, cevap harfi) çiftlerini üretir.
+    Sayfanın son satırı yarım kalmış olabileceği için bir sonraki sayfaya taşınır.
+    """
+    carry = ""
+    for page_text in page_texts:
+        buffer = carry + page_text
+        cut = buffer.rfind("\n") + 1
+        carry = buffer[cut:]
+        for match in ANSWER_PATTERN.finditer(buffer, 0, cut):
+            yield match.group(1).strip(), match.group(2).strip().lower()
+
+    for match in ANSWER_PATTERN.finditer(carry):
+        yield match.group(1).strip(), match.group(2).strip().lower()
@@ -0,0 +1,182 @@
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from scheduler import LeitnerScheduler
+
+
+# Oturumdan kalıcı depoya yazılan anahtarlar. Widget anahtarları (q0, jump_input vb.)
+# yazılmaz; şık ön seçimi zaten user_answers/exam_answers üzerinden yapılır.
+PLAIN_KEYS = (
+    "index",
+    "user_answers",
+    "first_attempt_statuses",
+    "review_mode_active",
+    "exam_mode_active",
+    "exam_submitted",
+    "exam_answers",
+    "questions_answered_in_exam",
+    "exam_results",
+    "review_exam_incorrect_active",
+    "exam_blueprint_id",
+    "spaced_repetition_active",
+    "search_list_active",
+)
+# Banka indeks dizileri; yalnızca aynı bankaya (aynı parmak izine) geri yüklenebilir
+INDEX_KEYS = ("current_indices", "exam_indices", "exam_incorrect_indices")
+# Scoreboard nesneleri; yalnızca durum sözlükleri saklanır
+SCOREBOARD_KEYS = ("question_statuses", "exam_scoreboard")
+# Aralıklı tekrar planlayıcısı; banka indeksleriyle çalıştığı için yalnızca aynı bankaya geri yüklenir
+SCHEDULER_KEY = "scheduler"
+
+logger = logging.getLogger("isg.progress")
+
+
+class ProgressStore:
+    """
+    Oturum ilerlemesini yerel bir SQLite dosyasında saklar.
+    save() durumu JSON'a çevirip yalnızca bellekteki bekleme tablosunu günceller (her kullanıcının
+    en son durumu); tabloda oturumla paylaşılan nesne tutulmaz. Diske yazma arka plandaki bir iş parçacığında toplu olarak yapılır. Böylece cevap
+    tıklaması hiçbir zaman disk beklemez.
+    """
+
+    def __init__(self, path, flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS progress ("
+                " token TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+
+        self._writer = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def save(self, token, data):
+        """Kullanıcının son durumunu yazılmak üzere sıraya alır (aynı kullanıcının eski kaydının üzerine yazar)."""
+        payload = json.dumps(data, ensure_ascii=False)
+        with self._lock:
+            self._pending[token] = payload
+
+    def load(self, token):
+        """Kullanıcının kayıtlı durumunu döndürür; henüz diske yazılmamış olanı önceliklidir."""
+        with self._lock:
+            payload = self._pending.get(token)
+        if payload is None:
+            with self._connect() as conn:
+                row = conn.execute("SELECT data FROM progress WHERE token = ?", (token,)).fetchone()
+            payload = row[0] if row else None
+        return json.loads(payload) if payload is not None else None
+
+    def flush(self):
+        """Bekleyen tüm kayıtları tek bir işlemde diske yazar."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        now = time.time()
+        rows = [(token, payload, now) for token, payload in pending.items()]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT INTO progress (token, data, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(token) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                    rows,
+                )
+        except sqlite3.Error:
+            # Yazılamayan kayıtlar, bu arada daha yenisi gelmediyse bir sonraki tur için geri konur
+            with self._lock:
+                for token, payload in pending.items():
+                    self._pending.setdefault(token, payload)
+            raise
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass # Kayıtlar sırada kaldı, bir sonraki turda tekrar denenecek
+            except Exception:
+                # Beklenmeyen bir hata yazıcıyı durdurmamalı; durdursaydı ilerleme bir daha kaydedilmezdi
+                logger.exception("İlerleme %s dosyasına yazılamadı", self.path)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=5)
+        self.flush()
+
+
+def export_progress(session_state, bank_fingerprint):
+    """
+    Oturum durumunun kalıcı depoya yazılacak, JSON'a çevrilebilir bir kopyasını üretir.
+    """
+    data = {"bank": bank_fingerprint}
+    for key in PLAIN_KEYS:
+        if key in session_state:
+            value = session_state[key]
+            data[key] = dict(value) if isinstance(value, dict) else value
+    for key in INDEX_KEYS:
+        if key in session_state:
+            data[key] = list(session_state[key])
+    for key in SCOREBOARD_KEYS:
+        if key in session_state:
+            data[key] = list(session_state[key].statuses.items())
+    if SCHEDULER_KEY in session_state:
+        data[SCHEDULER_KEY] = session_state[SCHEDULER_KEY].to_dict()
+    return data
+
+
+def clear_progress(session_state):
+    """Kalıcı depoya yazılan tüm anahtarları oturumdan siler (ör. başka bir bankaya geçerken)."""
+    for key in PLAIN_KEYS + INDEX_KEYS + SCOREBOARD_KEYS + (SCHEDULER_KEY,):
+        if key in session_state:
+            del session_state[key]
+
+
+def restore_progress(session_state, data, bank, bank_fingerprint, scoreboard_factory):
+    """
+    Kayıtlı durumu oturuma geri yükler. Kayıt farklı bir bankaya aitse indeks içeren
+    alanlar atlanır; soru numarasına bağlı cevaplar korunur ve liste baştan başlar.
+    """
+    same_bank = data.get("bank") == bank_fingerprint
+    for key in PLAIN_KEYS:
+        if key in data:
+            session_state[key] = data[key]
+    if same_bank:
+        for key in INDEX_KEYS:
+            if key in data:
+                session_state[key] = bank.indices(i for i in data[key] if i < len(bank))
+        if SCHEDULER_KEY in data:
+            session_state[SCHEDULER_KEY] = LeitnerScheduler.from_dict(data[SCHEDULER_KEY])
+    else:
+        # İndeksler başka bir bankaya ait; sınav durumu ve konum sıfırlanır
+        session_state["index"] = 0
+        for key in ("exam_mode_active", "exam_submitted", "review_mode_active", "review_exam_incorrect_active",
+                    "spaced_repetition_active", "search_list_active"):
+            session_state[key] = False
+    for key in SCOREBOARD_KEYS:
+        if key in data and (same_bank or key != "exam_scoreboard"):
+            scoreboard = scoreboard_factory()
+            for item_key, status in data[key]:
+                scoreboard.record(item_key, status)
+            session_state[key] = scoreboard
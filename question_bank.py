@@ -0,0 +1,108 @@
+from array import array
+from types import MappingProxyType
+
+
+# Anahtar dizisinde cevabı olmayan sorunun değeri
+NO_ANSWER = 0
+
+
+def normalize_letter(text):
+    """Şık metninin veya anahtar değerinin küçük harfli ilk harfi (BOM ve boşluklar atılır); boşsa ""."""
+    return text.replace("\ufeff", "").strip()[:1].lower()
+
+
+class Question:
+    """
+    Bankadaki tek bir soru. Şık harfleri yüklemede bir kez normalleştirilir: letters[i], i. şıkkın
+    harfidir; option_index harften şık konumuna gider (aynı harf dizisine sahip sorular aynı
+    sözlüğü paylaşır). Nesne oluşturulduktan sonra değiştirilemez.
+    """
+
+    __slots__ = ("number", "question", "options", "letters", "option_index", "region", "has_figure")
+
+    def __init__(self, number, question, options, letters, option_index, region=None, has_figure=False):
+        for name, value in zip(self.__slots__, (number, question, options, letters, option_index, region, has_figure)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Soru bankası salt okunurdur")
+
+    def __repr__(self):
+        return f"Question({self.number!r})"
+
+
+class QuestionBank:
+    """
+    Süreç genelinde tek kopya olarak tutulan, salt okunur soru bankası.
+    Oturumlar soruların kendisini değil, yalnızca bu bankadaki sıra numaralarını (indeks) saklar.
+    Cevap anahtarı, soru indeksleriyle hizalı bir bayt dizisidir (harfin kodu; yoksa NO_ANSWER),
+    böylece doğru cevap kontrolü her tıklamada metin işlemeden sabit zamanda yapılır.
+    """
+
+    __slots__ = ("questions", "key", "fingerprint", "_index_by_number")
+
+    def __init__(self, questions, answers, fingerprint=None):
+        # Aynı harf dizisine ("abcd") sahip soruların harf -> konum sözlükleri paylaşılır
+        option_maps = {}
+        records = []
+        for q in questions:
+            options = tuple(q["options"])
+            letters = "".join(normalize_letter(opt) or "?" for opt in options)
+            option_index = option_maps.get(letters)
+            if option_index is None:
+                positions = {}
+                for i, letter in enumerate(letters):
+                    positions.setdefault(letter, i)
+                option_index = option_maps[letters] = MappingProxyType(positions)
+            records.append(Question(
+                q["number"], q["question"], options, letters, option_index,
+                # PDF kaynaklarında sorunun sayfası ve bölgesi ([sayfa, x0, y0, x1, y1]); diğerlerinde None
+                tuple(q["region"]) if q.get("region") else None,
+                bool(q.get("has_figure")),
+            ))
+        self.questions = tuple(records)
+
+        key = bytearray(len(records))
+        for i, record in enumerate(records):
+            letter = normalize_letter(answers.get(record.number, ""))
+            if letter and letter.isascii():
+                key[i] = ord(letter)
+        self.key = bytes(key)
+        # Kaynak dosyaların parmak izi; kayıtlı indekslerin bu bankaya ait olup olmadığını anlamak için
+        self.fingerprint = fingerprint
+        self._index_by_number = MappingProxyType(
+            {q.number: i for i, q in enumerate(self.questions)}
+        )
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __getitem__(self, index):
+        return self.questions[index]
+
+    def index_of(self, question_number):
+        """Soru numarasına (örn. '501') karşılık gelen indeksi döndürür, yoksa None."""
+        return self._index_by_number.get(question_number)
+
+    @property
+    def answer_count(self):
+        """Cevap anahtarı olan soru sayısı."""
+        return len(self.key) - self.key.count(NO_ANSWER)
+
+    def correct_letter(self, index):
+        """Sorunun doğru şık harfi; anahtarı yoksa None."""
+        code = self.key[index]
+        return chr(code) if code != NO_ANSWER else None
+
+    def check(self, index, letter):
+        """Harf doğruysa True, yanlışsa False; sorunun anahtarı yoksa None."""
+        code = self.key[index]
+        return None if code == NO_ANSWER else code == ord(letter)
+
+    def all_indices(self):
+        """Bankadaki tüm soruların indekslerini kompakt bir dizi olarak döndürür."""
+        return array("I", range(len(self.questions)))
+
+    def indices(self, iterable):
+        """Verilen indeksleri oturumda saklanacak kompakt bir diziye dönüştürür."""
+        return array("I", iterable)
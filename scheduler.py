@@ -0,0 +1,93 @@
+import heapq
+
+
+# Leitner kutularının tekrar aralıkları, "cevap adımı" cinsinden (kutu 0: hemen tekrar)
+BOX_INTERVALS = (2, 5, 15, 40, 100, 250)
+
+
+class LeitnerScheduler:
+    """
+    Aralıklı tekrar için Leitner planlayıcısı.
+    Her soru bir kutudadır; doğru cevap bir üst kutuya, yanlış cevap ilk kutuya taşır.
+    Sorular, tekrar zamanına (mantıksal saat = verilen cevap sayısı) göre bir min-heap'te
+    tutulur; sıradaki soruyu seçmek O(log n)'dir. Güncellenen soruların eski heap
+    kayıtları silinmez, seçim sırasında geçersiz sayılıp atlanır.
+    """
+
+    __slots__ = ("question_count", "clock", "boxes", "due", "next_new", "_heap")
+
+    def __init__(self, question_count):
+        self.question_count = question_count
+        self.clock = 0
+        self.boxes = {} # banka indeksi -> kutu
+        self.due = {} # banka indeksi -> tekrar zamanı
+        self.next_new = 0 # Henüz görülmemiş soruların sırayla tanıtılacağı konum
+        self._heap = []
+
+    def record(self, bank_idx, correct):
+        """Bir cevabı işler ve sorunun bir sonraki tekrar zamanını heap'e ekler."""
+        self.clock += 1
+        box = min(self.boxes.get(bank_idx, 0) + 1, len(BOX_INTERVALS) - 1) if correct else 0
+        self.boxes[bank_idx] = box
+        due = self.clock + BOX_INTERVALS[box]
+        self.due[bank_idx] = due
+        heapq.heappush(self._heap, (due, bank_idx))
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and self.due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _peek(self, exclude):
+        """Heap'teki en erken (geçerli) kaydı döndürür; exclude ise bir sonrakine bakılır."""
+        self._drop_stale()
+        if not self._heap:
+            return None
+        if self._heap[0][1] != exclude:
+            return self._heap[0]
+        top = heapq.heappop(self._heap)
+        self._drop_stale()
+        candidate = self._heap[0] if self._heap else None
+        heapq.heappush(self._heap, top)
+        return candidate
+
+    def next_question(self, exclude=None):
+        """
+        Çalışılacak sıradaki sorunun banka indeksini döndürür:
+        zamanı gelmiş bir tekrar varsa o, yoksa henüz görülmemiş sıradaki soru,
+        o da yoksa tekrar zamanı en yakın soru. exclude (ör. ekrandaki soru) atlanır.
+        """
+        entry = self._peek(exclude)
+        if entry is not None and entry[0] <= self.clock:
+            return entry[1]
+
+        while self.next_new < self.question_count and self.next_new in self.due:
+            self.next_new += 1
+        # Atlanan (exclude) yeni soru tüketilmez; cevaplanana kadar sırada kalır ve yeniden sunulur
+        candidate = self.next_new
+        while candidate < self.question_count and (candidate in self.due or candidate == exclude):
+            candidate += 1
+        if candidate < self.question_count:
+            return candidate
+
+        return entry[1] if entry is not None else exclude
+
+    def to_dict(self):
+        return {
+            "question_count": self.question_count,
+            "clock": self.clock,
+            "next_new": self.next_new,
+            "boxes": list(self.boxes.items()),
+            "due": list(self.due.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        scheduler = cls(data["question_count"])
+        scheduler.clock = data["clock"]
+        scheduler.next_new = data["next_new"]
+        scheduler.boxes = dict((int(k), v) for k, v in data["boxes"])
+        scheduler.due = dict((int(k), v) for k, v in data["due"])
+        scheduler._heap = [(due, idx) for idx, due in scheduler.due.items()]
+        heapq.heapify(scheduler._heap)
+        return scheduler
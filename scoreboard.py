@@ -0,0 +1,45 @@
+class Scoreboard:
+    """
+    Soru durumlarını (True: doğru, False: yanlış, None: cevap anahtarı yok) ve
+    doğru/yanlış sayılarını birlikte tutar. Her güncelleme yalnızca eski ve yeni
+    duruma bakar; sayılar hiçbir zaman tüm durumlar taranarak yeniden hesaplanmaz.
+    """
+
+    __slots__ = ("statuses", "correct", "incorrect", "incorrect_keys")
+
+    def __init__(self):
+        self.statuses = {}
+        self.correct = 0
+        self.incorrect = 0
+        # Yanlış cevaplanan anahtarlar, cevaplanma sırasıyla (sıralı küme olarak dict)
+        self.incorrect_keys = {}
+
+    def __len__(self):
+        """Durumu kaydedilmiş (cevaplanmış) soru sayısı."""
+        return len(self.statuses)
+
+    def __contains__(self, key):
+        return key in self.statuses
+
+    def get(self, key, default=None):
+        return self.statuses.get(key, default)
+
+    def record(self, key, status):
+        """
+        Sorunun yeni durumunu kaydeder ve sayıları geçişe göre günceller
+        (cevapsız→doğru, doğru→yanlış vb.). Sabit zamanlıdır.
+        """
+        if key in self.statuses:
+            previous = self.statuses[key]
+            if previous is True:
+                self.correct -= 1
+            elif previous is False:
+                self.incorrect -= 1
+                del self.incorrect_keys[key]
+
+        self.statuses[key] = status
+        if status is True:
+            self.correct += 1
+        elif status is False:
+            self.incorrect += 1
+            self.incorrect_keys[key] = True
@@ -0,0 +1,79 @@
+import re
+from array import array
+from bisect import bisect_left
+
+
+# Türkçe büyük/küçük harf eşlemesi Python'un lower() davranışından farklıdır ('I' -> 'ı', 'İ' -> 'i').
+# Ardından şapkalı/noktalı harfler sadeleştirilir; böylece "isci", "İşçi" ve "IŞÇI" aynı terime düşer
+# ve Türkçe klavyesi olmayan kullanıcılar da arama yapabilir.
+_UPPER_MAP = str.maketrans({"I": "ı", "İ": "i"})
+_FOLD_MAP = str.maketrans({
+    "ı": "i", "ş": "s", "ğ": "g", "ü": "u", "ö": "o", "ç": "c",
+    "â": "a", "î": "i", "û": "u", "\u0307": None, # Ayrık yazılmış "İ" içindeki birleşik nokta
+})
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text):
+    """Metni Türkçe kurallarına göre küçük harfe çevirip aksanlardan arındırır."""
+    return text.translate(_UPPER_MAP).lower().translate(_FOLD_MAP)
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+class SearchIndex:
+    """
+    Soru metinleri ve şıklar üzerinde ters indeks (terim -> soru indeksleri).
+    Banka yüklenirken bir kez kurulur; sorgu, terimlerin indeks listelerinin kesişimidir ve
+    bankayı taramaz. Sorgudaki son kelime önek olarak aranır (yazarken arama için).
+    """
+
+    __slots__ = ("_postings", "_terms")
+
+    def __init__(self, bank):
+        postings = {}
+        for i, q in enumerate(bank):
+            text = " ".join((q.number, q.question) + q.options)
+            for term in set(tokenize(text)):
+                postings.setdefault(term, []).append(i)
+        # İndeksler artan sırada eklendiği için listeler sıralıdır
+        self._postings = {term: array("I", ids) for term, ids in postings.items()}
+        self._terms = sorted(self._postings) # Önek araması için
+
+    def __len__(self):
+        return len(self._terms)
+
+    def _prefix_matches(self, prefix):
+        """Öneki taşıyan tüm terimlerin indekslerinin birleşimi."""
+        ids = set()
+        start = bisect_left(self._terms, prefix)
+        for term in self._terms[start:]:
+            if not term.startswith(prefix):
+                break
+            ids.update(self._postings[term])
+        return ids
+
+    def search(self, query):
+        """
+        Sorgudaki tüm kelimeleri içeren soruların indekslerini (banka sırasıyla) döndürür.
+        Boş sorgu için boş dizi döner.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return array("I")
+        *exact, prefix = terms
+        candidates = [self._postings.get(term, ()) for term in exact]
+        candidates.sort(key=len) # Kesişime en kısa listeyle başlanır
+        if candidates:
+            result = set(candidates[0])
+            for ids in candidates[1:]:
+                result.intersection_update(ids)
+                if not result:
+                    break
+            if result:
+                result &= self._prefix_matches(prefix)
+        else:
+            result = self._prefix_matches(prefix)
+        return array("I", sorted(result))
@@ -0,0 +1,143 @@
+"""
+Soru bankasını, sunucu gerektirmeyen tek dosyalık bir HTML/JS alıştırma sayfasına dönüştürür.
+
+Sorular, cevap anahtarı ve önceden üretilmiş sınav kalıpları sayfanın içine gömülür;
+alıştırma (doğru cevapta otomatik ilerleme, ilk deneme takibi, ilk denemede yanlışları tekrar)
+ve sınav (tek cevap, puanlama, yanlışları inceleme) mantığı tamamen tarayıcıda çalışır.
+İlerleme tarayıcının localStorage'ında bankanın parmak izine göre saklanır. Çıktı herhangi bir
+statik dosya sunucusundan (veya doğrudan diskten) açılabilir.
+
+Cevap anahtarı sayfanın içinde yer aldığından bu çıktı yalnızca gözetimsiz alıştırma içindir.
+Sınav kalıpları --seed (varsayılan ISG_EXAM_SEED, yoksa 0) tohumundan başlayarak üretilir;
+uygulama aynı ISG_EXAM_SEED ile çalışıyorsa aynı banka için ?sinav=S20-K5-3 gibi bir kod iki
+tarafta da aynı soruları verir.
+
+Kullanım:
+    python static_export.py --output isg_alistirma.html
+    python static_export.py --catalog bankalar.json --bank a-sinifi --output a_sinifi.html
+"""
+import argparse
+import html
+import json
+import os
+import sys
+
+from bank_catalog import load_catalog, source_paths
+from bank_snapshot import source_fingerprint, load_snapshot
+from blueprints import generate_blueprints
+from dedup import collapse_clusters, find_duplicate_clusters
+from loaders import QUESTION_SOURCES, ANSWER_SOURCES, pick_source, figure_source, load_questions, load_answers
+from question_bank import NO_ANSWER as KEY_NO_ANSWER, QuestionBank
+
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static_export.html")
+DATA_PLACEHOLDER = "/*__BANK_DATA__*/null"
+TITLE_PLACEHOLDER = "__PAGE_TITLE__"
+DEFAULT_TITLE = "İSG Sınav Uygulaması"
+NO_ANSWER = "-" # Anahtar dizisinde cevabı olmayan sorunun yeri
+
+
+def load_bank(questions_path, answers_path, collapse_duplicates=False, figures_path=None):
+    """
+    Bankayı derlenmiş anlık görüntüden, yoksa kaynak dosyalardan yükler.
+    collapse_duplicates ise uygulamadaki gibi kopya kümelerinden yalnızca ilk soru bırakılır.
+    figures_path, uygulamayla aynı anlık görüntünün bulunması için bankanın şekil PDF'idir.
+    """
+    fingerprint = source_fingerprint(*source_paths(questions_path, answers_path, figures_path))
+    snapshot = load_snapshot(fingerprint)
+    if snapshot is not None:
+        questions, answers, duplicates = snapshot["questions"], snapshot["answers"], snapshot["duplicates"]
+    else:
+        questions = load_questions(questions_path, figures_path=figures_path)
+        answers = load_answers(answers_path)
+        duplicates = find_duplicate_clusters(questions) if collapse_duplicates else []
+    if collapse_duplicates and duplicates:
+        questions = collapse_clusters(questions, duplicates)
+        fingerprint = f"{fingerprint}-tekil"
+    return QuestionBank(questions, answers, fingerprint)
+
+
+def build_payload(bank, title, exam_size, exam_strata, blueprint_count, base_seed=0):
+    """
+    Sayfaya gömülecek veriyi hazırlar. Şık harfleri ve anahtar bankada zaten normalleştirilmiştir;
+    anahtar soru indeksleriyle hizalı tek bir dizgedir (cevabı olmayan soru için NO_ANSWER).
+    """
+    key = "".join(NO_ANSWER if code == KEY_NO_ANSWER else chr(code) for code in bank.key)
+    blueprints = generate_blueprints(bank, blueprint_count, exam_size, base_seed, strata_count=exam_strata) if len(bank) else []
+    return {
+        "title": title,
+        "fingerprint": bank.fingerprint,
+        "noAnswer": NO_ANSWER,
+        "questions": [
+            [q.number, q.question, list(q.options), q.letters]
+            for q in bank
+        ],
+        "key": key,
+        "blueprints": [[b.id, list(b.indices)] for b in blueprints],
+    }
+
+
+def render_page(payload, template_path=TEMPLATE_PATH):
+    """Veriyi şablona gömer; JSON içindeki "</" dizileri script etiketini kapatmasın diye kaçırılır."""
+    with open(template_path, "r", encoding="utf-8") as f:
+        template = f.read()
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    return template.replace(TITLE_PLACEHOLDER, html.escape(payload["title"])).replace(DATA_PLACEHOLDER, data)
+
+
+def export_bank(bank, output_path, title=DEFAULT_TITLE, exam_size=20, exam_strata=5, blueprint_count=200, base_seed=0):
+    """Bankayı tek dosyalık HTML sayfası olarak yazar ve yazılan bayt sayısını döndürür."""
+    page = render_page(build_payload(bank, title, exam_size, exam_strata, max(1, blueprint_count), base_seed))
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(page)
+    os.replace(tmp_path, output_path)
+    return os.path.getsize(output_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soru bankasını sunucusuz çalışan tek dosyalık bir HTML sayfasına aktarır")
+    parser.add_argument("--questions", default=pick_source(QUESTION_SOURCES), help="Soru dosyası (DOCX, TXT veya PDF)")
+    parser.add_argument("--answers", default=pick_source(ANSWER_SOURCES), help="Cevap anahtarı (TXT, DOCX veya PDF)")
+    parser.add_argument("--catalog", help="Banka kataloğu (JSON); --bank ile birlikte kullanılır")
+    parser.add_argument("--bank", help="Katalogdan aktarılacak banka kimliği")
+    parser.add_argument("--output", default="isg_alistirma.html", help="Yazılacak HTML dosyası")
+    parser.add_argument("--title", help="Sayfa başlığı (varsayılan: banka adı)")
+    parser.add_argument("--exam-size", type=int, default=int(os.environ.get("ISG_EXAM_SIZE", "20")))
+    parser.add_argument("--exam-strata", type=int, default=int(os.environ.get("ISG_EXAM_STRATA", "5")))
+    parser.add_argument("--blueprints", type=int, default=int(os.environ.get("ISG_EXAM_BLUEPRINTS", "200")),
+                        help="Sayfaya gömülecek sınav kalıbı sayısı")
+    parser.add_argument("--seed", type=int, default=int(os.environ.get("ISG_EXAM_SEED") or "0"),
+                        help="İlk sınav kalıbının tohumu (uygulamadaki ISG_EXAM_SEED ile aynı olmalı)")
+    parser.add_argument("--collapse-duplicates", action="store_true",
+                        help="Neredeyse aynı soru kümelerinden yalnızca ilk soruyu aktar")
+    args = parser.parse_args(argv)
+
+    title = args.title or DEFAULT_TITLE
+    questions_path, answers_path = args.questions, args.answers
+    figures_path = figure_source(questions_path)
+    if args.catalog:
+        catalog = load_catalog(args.catalog)
+        bank_id = args.bank or next(iter(catalog))
+        if bank_id not in catalog:
+            parser.error(f"Katalogda olmayan banka: {bank_id}")
+        spec = catalog[bank_id]
+        questions_path, answers_path, figures_path = spec.questions_path, spec.answers_path, spec.figures_path
+        title = args.title or spec.name
+
+    try:
+        bank = load_bank(questions_path, answers_path, args.collapse_duplicates, figures_path)
+    except OSError as e:
+        print(f"Kaynak dosya okunamadı: {e}", file=sys.stderr)
+        return 2
+    if not len(bank) or not bank.answer_count:
+        print("Sayfa yazılmadı: sorular veya cevaplar boş.", file=sys.stderr)
+        return 2
+
+    size = export_bank(bank, args.output, title, args.exam_size, args.exam_strata, args.blueprints, args.seed)
+    print(f"{len(bank)} soru ve {args.blueprints} sınav kalıbı {args.output} dosyasına yazıldı ({size / 1024:.0f} KB).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
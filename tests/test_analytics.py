@@ -0,0 +1,38 @@
+import os
+
+from answer_analytics import AnswerAnalytics
+
+
+def test_stats_from_other_process_are_reloaded(tmp_path):
+    path = os.fspath(tmp_path / "analitik.sqlite3")
+    reader = AnswerAnalytics(path, flush_interval=60, refresh_interval=0)
+    writer = AnswerAnalytics(path, flush_interval=60)
+    try:
+        reader.record("banka", "1", "pratik", "a", True, True)
+        writer.record("banka", "1", "pratik", "b", False, True)
+        writer.record("banka", "2", "pratik", "c", True, True)
+        writer.flush()
+
+        # Okuyucunun yazılmamış kendi cevabı, diğer sürecin yazdıklarının üstüne eklenir
+        stats = reader.question_stats("banka", "1")
+        assert (stats.attempts, stats.correct, stats.first_tries) == (2, 1, 2)
+        assert stats.most_common_wrong == ("b", 1)
+        assert reader.first_try_accuracy("banka") == {"1": 0.5, "2": 1.0}
+
+        reader.flush()
+        assert reader.question_stats("banka", "1").attempts == 2
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_returned_stats_are_snapshots(tmp_path):
+    analytics = AnswerAnalytics(os.fspath(tmp_path / "analitik.sqlite3"), flush_interval=60)
+    try:
+        analytics.record("banka", "1", "pratik", "a", True, True)
+        snapshot = analytics.question_stats("banka", "1")
+        analytics.record("banka", "1", "pratik", "a", True, False)
+        assert snapshot.attempts == 1
+        assert analytics.bank_stats("banka")["1"].attempts == 2
+    finally:
+        analytics.close()
@@ -0,0 +1,39 @@
+import numpy as np
+
+from dedup import MinHasher, find_duplicate_clusters
+
+
+def _estimate(hasher, a, b):
+    return float(np.mean(hasher.signature(a) == hasher.signature(b)))
+
+
+def test_minhash_estimate_tracks_jaccard_for_partial_overlap():
+    # 200 ortak, 100 + 100 farklı shingle: gerçek Jaccard 200 / 400 = 0.5
+    rng = np.random.default_rng(7)
+    pool = np.unique(rng.integers(0, 1 << 32, 1000, dtype=np.uint64))[:400]
+    a = np.concatenate([pool[:200], pool[200:300]])
+    b = np.concatenate([pool[:200], pool[300:400]])
+    hasher = MinHasher(num_perm=256)
+    assert abs(_estimate(hasher, a, b) - 0.5) < 0.1
+
+
+def test_minhash_identical_and_disjoint():
+    rng = np.random.default_rng(11)
+    pool = np.unique(rng.integers(0, 1 << 32, 500, dtype=np.uint64))[:200]
+    hasher = MinHasher()
+    assert _estimate(hasher, pool[:100], pool[:100]) == 1.0
+    assert _estimate(hasher, pool[:100], pool[100:]) < 0.1
+
+
+def _question(number, text, options):
+    return {"number": number, "question": text, "options": options}
+
+
+def test_half_overlapping_questions_are_not_clustered():
+    options = ["a) 1 ay", "b) 3 ay", "c) 6 ay", "d) 1 yıl"]
+    questions = [
+        _question("1", "karbondioksitli yangın söndürme cihazları kaç ayda bir kontrol edilmelidir", options),
+        _question("2", "karbondioksitli yangın söndürme cihazları kaç ayda bir kontrol edilmelidir", options),
+        _question("3", "kuru kimyevi tozlu yangın söndürme cihazları kaç yılda bir dolum yapılmalıdır", options),
+    ]
+    assert find_duplicate_clusters(questions) == [[0, 1]]
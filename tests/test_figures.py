@@ -0,0 +1,75 @@
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from figures import FigureCache
+from loaders import FIGURE_SOURCES, figure_source, load_questions
+
+
+QUESTIONS = (
+    ("1. Aşağıdaki işaret neyi belirtir?", ("a) Yasak", "b) Uyarı", "c) Emredici", "d) Bilgi")),
+    ("2. Yangın söndürücüler kaç ayda bir kontrol edilir?", ("a) 1", "b) 3", "c) 6", "d) 12")),
+)
+
+
+def _write_pdf(path):
+    """İlk sayfada şekilli (çizimli), ikinci sayfada şekilsiz bir soru içeren PDF."""
+    doc = fitz.open()
+    for page_number, (question, options) in enumerate(QUESTIONS):
+        page = doc.new_page()
+        page.insert_text((72, 72), question)
+        y = 100
+        if page_number == 0:
+            page.draw_rect(fitz.Rect(72, 90, 172, 170), color=(1, 0, 0), width=3)
+            y = 190
+        for option in options:
+            page.insert_text((72, y), option)
+            y += 16
+    doc.save(path)
+    doc.close()
+
+
+def _write_text(path):
+    with open(path, "w", encoding="utf-8") as f:
+        for question, options in QUESTIONS:
+            f.write(question + "\n" + "\n".join(options) + "\n")
+
+
+@pytest.fixture
+def figure_pdf(tmp_path):
+    path = tmp_path / FIGURE_SOURCES[0]
+    _write_pdf(str(path))
+    return str(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pdf_questions_get_regions_and_figure_flags(figure_pdf, workers):
+    questions = load_questions(figure_pdf, workers=workers)
+    assert [q["number"] for q in questions] == ["1", "2"]
+    assert questions[0]["has_figure"] is True
+    assert questions[1]["has_figure"] is False
+    page, x0, y0, x1, y1 = questions[0]["region"]
+    assert page == 0 and y0 < 90 and y1 >= 170
+    assert questions[1]["region"][0] == 1
+
+
+def test_text_bank_takes_regions_from_companion_pdf(figure_pdf, tmp_path):
+    text_path = str(tmp_path / "sorular.txt")
+    _write_text(text_path)
+    assert figure_source(text_path) == figure_pdf
+    assert not any("region" in q for q in load_questions(text_path))
+
+    questions = load_questions(text_path, figures_path=figure_source(text_path))
+    assert [q["has_figure"] for q in questions] == [True, False]
+    pdf_questions = load_questions(figure_pdf)
+    assert [q["region"] for q in questions] == [q["region"] for q in pdf_questions]
+
+
+def test_figure_cache_renders_once(figure_pdf, tmp_path):
+    region = load_questions(figure_pdf)[0]["region"]
+    cache = FigureCache(str(tmp_path / "cache"), dpi=72)
+    image = cache.get(figure_pdf, region)
+    assert image.startswith(b"\x89PNG")
+    path = cache.path_for(figure_pdf, region)
+    assert open(path, "rb").read() == image
+    assert cache.get(figure_pdf, region) == image
@@ -0,0 +1,60 @@
+import os
+import threading
+
+from progress_store import ProgressStore
+
+
+def test_loaded_state_is_independent_of_pending_save(tmp_path):
+    store = ProgressStore(os.fspath(tmp_path / "ilerleme.sqlite3"), flush_interval=60)
+    try:
+        state = {"index": 0, "user_answers": {}}
+        store.save("oturum", state)
+        state["user_answers"]["1"] = "a"
+
+        loaded = store.load("oturum")
+        assert loaded == {"index": 0, "user_answers": {}}
+
+        # Yüklenen durum oturumda değiştirilirken yazıcı bekleyen kaydı diske yazar
+        stop = threading.Event()
+
+        def mutate():
+            i = 0
+            while not stop.is_set():
+                loaded["user_answers"][str(i)] = "b"
+                i += 1
+
+        worker = threading.Thread(target=mutate)
+        worker.start()
+        try:
+            for _ in range(50):
+                store.save("oturum", {"index": 1, "user_answers": {}})
+                store.flush()
+        finally:
+            stop.set()
+            worker.join()
+
+        assert store.load("oturum") == {"index": 1, "user_answers": {}}
+    finally:
+        store.close()
+
+
+def test_writer_survives_unexpected_errors(tmp_path, monkeypatch):
+    store = ProgressStore(os.fspath(tmp_path / "ilerleme.sqlite3"), flush_interval=0.01)
+    try:
+        flushed = threading.Event()
+        calls = []
+        original_flush = store.flush
+
+        def flaky_flush():
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError("beklenmeyen hata")
+            original_flush()
+            flushed.set()
+
+        monkeypatch.setattr(store, "flush", flaky_flush)
+        assert flushed.wait(5)
+        assert store._writer.is_alive()
+    finally:
+        monkeypatch.undo()
+        store.close()